@@ -1,11 +1,49 @@
 from typing import List
 from docx import Document
+from docx.oxml.ns import qn
+
+_W_P = qn('w:p')
+_W_R = qn('w:r')
+_W_HYPERLINK = qn('w:hyperlink')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TYPE = qn('w:type')
+# Paragraph.text와 같게 런 안의 탭/줄바꿈 요소를 글자로 바꿈 (쪽/단 나누기 w:br은 빈 문자열)
+_RUN_CHILD_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+
+def _run_text(run) -> str:
+    """w:r 요소의 자식들을 문서 순서대로 글자로 바꿔 이어 붙입니다 (글상자 등 다른 자식은 건너뜀)."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or '')
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        else:
+            parts.append(_RUN_CHILD_TEXT.get(tag, ''))
+    return ''.join(parts)
+
+def _paragraph_text(p) -> str:
+    """w:p 요소의 직접 자식 런(하이퍼링크 안의 런 포함) 텍스트를 모읍니다."""
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.iterchildren(_W_R))
+    return ''.join(parts)
 
 def extract_text_from_docx(file_path: str) -> str:
     """docx 파일에서 텍스트를 추출합니다."""
     doc = Document(file_path)
-    text = '\n'.join([para.text for para in doc.paragraphs])
+    # Paragraph 래퍼를 만들지 않고 본문 w:p 요소의 런 텍스트를 lxml에서 바로 모음
+    body = doc.element.body
+    text = '\n'.join(_paragraph_text(p) for p in body.iterchildren(_W_P))
     return text
-
-
-
@@ -1,10 +1,10 @@
-import json
+import orjson
 from typing import Any
 
 def load_json_file(file_path: str) -> Any:
     """json 파일을 로드합니다."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 
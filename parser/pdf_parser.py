@@ -1,15 +1,42 @@
-from typing import Optional
-import pdfplumber
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+import pymupdf
+
+logger = logging.getLogger(__name__)
+
+# 이 쪽수를 넘는 PDF만 여러 프로세스로 나눠 추출 (프로세스 시작 비용 때문)
+_PARALLEL_MIN_PAGES = 32
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """start부터 stop 전까지 페이지의 텍스트를 추출합니다 (워커 프로세스에서 실행)."""
+    with pymupdf.open(file_path) as doc:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+
+def _extract_pages_parallel(file_path: str, page_count: int, workers: int) -> List[str]:
+    """페이지 범위를 워커 수만큼 나눠 병렬로 추출하고 페이지 순서대로 합칩니다."""
+    chunk_size = -(-page_count // workers)
+    starts = list(range(0, page_count, chunk_size))
+    stops = [min(start + chunk_size, page_count) for start in starts]
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        chunks = executor.map(_extract_page_range, [file_path] * len(starts), starts, stops)
+        return [page_text for chunk in chunks for page_text in chunk]
 
 def extract_text_from_pdf(file_path: str) -> Optional[str]:
     try:
-        with pdfplumber.open(file_path) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
+        with pymupdf.open(file_path) as doc:
+            page_count = doc.page_count
+            workers = min(os.cpu_count() or 1, page_count)
+            if page_count <= _PARALLEL_MIN_PAGES or workers <= 1:
+                page_texts = [page.get_text("text") for page in doc]
+            else:
+                page_texts = None
+        if page_texts is None:
+            page_texts = _extract_pages_parallel(file_path, page_count, workers)
+        # PyMuPDF는 페이지 텍스트 끝에 줄바꿈을 붙이므로 떼어낸 뒤 한 줄바꿈으로 이어 붙임 (페이지 사이 빈 줄 없음)
+        parts = [page_text.rstrip("\n") for page_text in page_texts]
+        return "\n".join(part for part in parts if part).strip()
     except Exception as e:
-        print(f"PDF 파싱 오류: {e}")
-        return None 
\ No newline at end of file
+        logger.error("PDF 파싱 오류: %s", e)
+        return None
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional
 
 
@@ -10,7 +10,7 @@ class CompositionPerUnit(BaseModel):
     component_name: str
     role: str
     amount: str
-    standard: Optional[str]
+    standard: Optional[str] = None
 
 class Overages(BaseModel):
     component_name: str
@@ -26,38 +26,38 @@ class ContainerClosureSecondary(BaseModel):
 
 class ContainerClosureSystem(BaseModel):
     primary: ContainerClosurePrimary
-    secondary: Optional[ContainerClosureSecondary]
+    secondary: Optional[ContainerClosureSecondary] = None
 
 class ReconstitutionDiluent(BaseModel):
-    name: Optional[str]
-    compatibility: Optional[str]
-    in_use_storage: Optional[str]
+    name: Optional[str] = None
+    compatibility: Optional[str] = None
+    in_use_storage: Optional[str] = None
 
 class PerformanceCharacteristics(BaseModel):
-    dissolution: Optional[str]
-    disintegration: Optional[str]
-    bioavailability: Optional[str]
-    other_properties: Optional[List[str]]
+    dissolution: Optional[str] = None
+    disintegration: Optional[str] = None
+    bioavailability: Optional[str] = None
+    other_properties: Optional[List[str]] = None
 
 class Preservative(BaseModel):
-    name: Optional[str]
-    efficacy: Optional[str]
+    name: Optional[str] = None
+    efficacy: Optional[str] = None
 
 class MicrobiologicalAttributes(BaseModel):
-    preservative: Optional[Preservative]
-    sterility_info: Optional[str]
+    preservative: Optional[Preservative] = None
+    sterility_info: Optional[str] = None
 
 class CriticalMaterial(BaseModel):
     name: str
     impact: str
 
 class ClinicalBatchInfo(BaseModel):
-    difference_from_commercial: Optional[str]
+    difference_from_commercial: Optional[str] = None
 
 class DevelopmentHistory(BaseModel):
-    justification_for_formulation: Optional[str]
-    critical_materials: Optional[List[CriticalMaterial]]
-    clinical_batch_info: Optional[ClinicalBatchInfo]
+    justification_for_formulation: Optional[str] = None
+    critical_materials: Optional[List[CriticalMaterial]] = None
+    clinical_batch_info: Optional[ClinicalBatchInfo] = None
 
 class ProductOverview(BaseModel):
     product_name: str
@@ -65,11 +65,18 @@ class ProductOverview(BaseModel):
     strength: str
     appearance: Appearance
     composition_per_unit: List[CompositionPerUnit]
-    overages: Optional[List[Overages]]
+    overages: Optional[List[Overages]] = None
     container_closure_system: ContainerClosureSystem
-    reconstitution_diluent: Optional[ReconstitutionDiluent]
-    performance_characteristics: Optional[PerformanceCharacteristics]
-    microbiological_attributes: Optional[MicrobiologicalAttributes]
-    development_history: Optional[DevelopmentHistory]
+    reconstitution_diluent: Optional[ReconstitutionDiluent] = None
+    performance_characteristics: Optional[PerformanceCharacteristics] = None
+    microbiological_attributes: Optional[MicrobiologicalAttributes] = None
+    development_history: Optional[DevelopmentHistory] = None
 
 
+# 스키마를 import 시점에 한 번만 빌드하고 검증기를 재사용
+# (이 저장소 안에서는 아직 호출하는 곳이 없음: ProductOverview 형태의 LLM 출력을 검증할 호출부를 위한 헬퍼)
+ProductOverview.model_rebuild()
+
+PRODUCT_OVERVIEW_ADAPTER = TypeAdapter(ProductOverview)
+validate_overview = PRODUCT_OVERVIEW_ADAPTER.validate_python
+validate_overview_json = PRODUCT_OVERVIEW_ADAPTER.validate_json
@@ -8,54 +8,128 @@ Ollama의 키워드 구분 및 연관성 파악 능력 향상을 위한 모듈
 
 import re
 import json
-from typing import List, Dict, Any, Tuple
+import time
+import heapq
+import functools
+import logging
+import ahocorasick
+import orjson
+from typing import List, Dict, Any, Tuple, Optional
 from collections import Counter
+from types import MappingProxyType
 from difflib import SequenceMatcher
 from llm.ollama_client import generate_overview_with_llm, test_ollama_connection
+from utils.keyword_processor import build_section_automaton, build_exact_section_index, lookup_section
 from utils.improved_prompts import (
     IMPROVED_SECTION_PROMPTS, 
     CONTEXT_ANALYSIS_PROMPT, 
-    KEYWORD_RELATIONSHIP_PROMPT
+    KEYWORD_RELATIONSHIP_PROMPT,
+    BATCH_SECTION_PROMPT_HEADER,
+    BATCH_SECTION_BLOCK
 )
 
+logger = logging.getLogger(__name__)
+
+_DIGIT_RE = re.compile(r'\d')
+
+# 기본 키워드 분류 규칙 (앞에 있는 섹션이 우선)
+_BASIC_SECTION_WORDS = [
+    ("제품 기본 정보", ['제품명', '제형', '정제', '주사제', '캡슐', '시럽', '연고', '크림', '정', '필름코팅정', '경구용', '필름', '코팅']),
+    ("외형 정보", ['외형', '모양', '색상', '색깔', '흰색', '노란색', '각인', '표시', '마크', '원형', '타원형']),
+    ("성분 정보", ['성분', '주성분', '첨가제', '결합제', '희석제', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드', '메트포르민', '파세타민', 'USP', 'EP', 'JP', '순도']),
+    ("용기 정보", ['용기', '포장', '병', '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터', '포일']),
+    ("개발 이력", ['개발', '연구', '제형개발', '처방개발', '선택근거', '개발근거', '임상', '시험', '제형', '처방', '선택', '근거']),
+    ("성능 특성", ['용출', '붕해', '생체이용률', '안정성', '성능', '특성', '분해', '용해도', '흡수', '배설', '생체', '이용률', '용해', '안정']),
+    ("미생물학적 특성", ['보존제', '멸균', '미생물', '무균', '살균', '방부제', '세균', '균', '보존', '멸균', '미생물', '무균', '살균', '방부']),
+    # 함량 정보는 성분 정보에 포함
+    ("성분 정보", ['mg', 'g', 'ml', 'mcg', '단위', '함량']),
+]
+
+_BASIC_SECTION_AUTOMATON = build_section_automaton(_BASIC_SECTION_WORDS)
+_BASIC_EXACT_SECTIONS = build_exact_section_index(_BASIC_SECTION_AUTOMATON, _BASIC_SECTION_WORDS)
+
+# 기본 감정 분석 단어
+_NEGATIVE_WORDS = ("부작용", "위험", "주의", "금기", "중단", "중지")
+_POSITIVE_WORDS = ("효과", "개선", "치료", "완화", "효능")
+
+# Ollama 연결 확인 결과를 재사용하는 시간 (초)
+_CONNECTION_CHECK_TTL = 10.0
+
+# 의약품 전문 지식 베이스
+_MEDICAL_KB = {
+    "active_ingredients": {
+        "analgesics": ["아스피린", "아세트아미노펜", "이부프로펜", "파세타민"],
+        "antidiabetics": ["세마글루타이드", "메트포르민", "글리메피리드"],
+        "antibiotics": ["아목시실린", "세파졸린", "독시사이클린"],
+        "antihypertensives": ["암로디핀", "로사르탄", "리시노프릴"]
+    },
+    "dosage_forms": {
+        "oral": ["정제", "캡슐", "시럽", "액제", "분말", "과립", "정", "필름코팅정"],
+        "injectable": ["주사제", "액제", "분말주사제"],
+        "topical": ["연고", "크림", "젤", "로션"],
+        "special": ["장용정", "서방정", "구강붕해정"]
+    },
+    "containers": {
+        "primary": ["병", "앰플", "바이알", "블리스터", "포일"],
+        "materials": ["플라스틱", "유리", "알루미늄", "종이"],
+        "secondary": ["카톤", "포일", "블리스터"]
+    },
+    "performance_indicators": {
+        "dissolution": ["용출", "용해도", "용해율"],
+        "disintegration": ["붕해", "붕해도", "붕해시간"],
+        "bioavailability": ["생체이용률", "흡수율", "흡수도"],
+        "stability": ["안정성", "분해", "변질"]
+    }
+}
+
+# 지식 베이스 분류별 역색인: 단어 -> 하위 그룹명
+_MEDICAL_KB_INDEX = MappingProxyType({
+    kb_section: MappingProxyType({
+        word: group_name
+        for group_name, words in reversed(list(groups.items()))
+        for word in words
+    })
+    for kb_section, groups in _MEDICAL_KB.items()
+})
+
+def _context_rank(keyword_with_context: Dict[str, Any]) -> Tuple[float, bool, bool]:
+    """신뢰도, 관련성, 감정 순의 정렬 키"""
+    context = keyword_with_context["context"]
+    return (
+        context["confidence"],
+        context["relevance"] == "high",
+        context["sentiment"] != "negative"
+    )
+
 class EnhancedKeywordAnalyzer:
     """개선된 키워드 분석기"""
     
     def __init__(self):
         self.medical_knowledge_base = self._load_medical_knowledge()
+        self._conn_check_ts = 0.0
+        self._conn_check_result = False
+    
+    def _conn_ok(self) -> bool:
+        """Ollama 연결 상태 확인 (결과를 _CONNECTION_CHECK_TTL초 동안 캐시)"""
+        now = time.monotonic()
+        if not self._conn_check_ts or now - self._conn_check_ts > _CONNECTION_CHECK_TTL:
+            self._conn_check_result = test_ollama_connection()
+            self._conn_check_ts = now
+        return self._conn_check_result
     
     def _load_medical_knowledge(self) -> Dict[str, Any]:
-        """의약품 전문 지식 베이스 로드"""
-        return {
-            "active_ingredients": {
-                "analgesics": ["아스피린", "아세트아미노펜", "이부프로펜", "파세타민"],
-                "antidiabetics": ["세마글루타이드", "메트포르민", "글리메피리드"],
-                "antibiotics": ["아목시실린", "세파졸린", "독시사이클린"],
-                "antihypertensives": ["암로디핀", "로사르탄", "리시노프릴"]
-            },
-            "dosage_forms": {
-                "oral": ["정제", "캡슐", "시럽", "액제", "분말", "과립", "정", "필름코팅정"],
-                "injectable": ["주사제", "액제", "분말주사제"],
-                "topical": ["연고", "크림", "젤", "로션"],
-                "special": ["장용정", "서방정", "구강붕해정"]
-            },
-            "containers": {
-                "primary": ["병", "앰플", "바이알", "블리스터", "포일"],
-                "materials": ["플라스틱", "유리", "알루미늄", "종이"],
-                "secondary": ["카톤", "포일", "블리스터"]
-            },
-            "performance_indicators": {
-                "dissolution": ["용출", "용해도", "용해율"],
-                "disintegration": ["붕해", "붕해도", "붕해시간"],
-                "bioavailability": ["생체이용률", "흡수율", "흡수도"],
-                "stability": ["안정성", "분해", "변질"]
-            }
-        }
+        """의약품 전문 지식 베이스 로드 (모듈 상수를 공유)"""
+        return _MEDICAL_KB
     
-    def analyze_keyword_context(self, text: str, keyword: str) -> Dict[str, Any]:
-        """키워드의 컨텍스트를 분석합니다."""
-        if not test_ollama_connection():
-            return self._fallback_context_analysis(text, keyword)
+    def analyze_keyword_context(self, text: str, keyword: str, keyword_index: Optional[int] = None) -> Dict[str, Any]:
+        """키워드의 컨텍스트를 분석합니다.
+
+        keyword_index를 주면 (미리 찾은 첫 등장 위치, 없으면 -1) 텍스트를 다시 검색하지 않습니다.
+        """
+        if not self._conn_ok():
+            if keyword_index is None:
+                return self._fallback_context_analysis(text, keyword)
+            return self._fallback_context_analysis_at(text, keyword, keyword_index)
         
         try:
             prompt = CONTEXT_ANALYSIS_PROMPT.format(
@@ -71,13 +145,15 @@ class EnhancedKeywordAnalyzer:
                 return self._fallback_context_analysis(text, keyword)
                 
         except Exception as e:
-            print(f"컨텍스트 분석 오류: {e}")
+            logger.error("컨텍스트 분석 오류: %s", e)
             return self._fallback_context_analysis(text, keyword)
     
     def _fallback_context_analysis(self, text: str, keyword: str) -> Dict[str, Any]:
         """Ollama 연결 실패 시 기본 컨텍스트 분석"""
-        # 키워드 주변 텍스트 추출
-        keyword_index = text.find(keyword)
+        return self._fallback_context_analysis_at(text, keyword, text.find(keyword))
+    
+    def _fallback_context_analysis_at(self, text: str, keyword: str, keyword_index: int) -> Dict[str, Any]:
+        """키워드 위치가 주어진 경우의 기본 컨텍스트 분석"""
         if keyword_index == -1:
             return {
                 "context": "키워드를 찾을 수 없음",
@@ -92,19 +168,12 @@ class EnhancedKeywordAnalyzer:
         end = min(len(text), keyword_index + len(keyword) + 50)
         context_text = text[start:end]
         
-        # 기본 감정 분석
-        negative_words = ["부작용", "위험", "주의", "금기", "중단", "중지"]
-        positive_words = ["효과", "개선", "치료", "완화", "효능"]
-        
+        # 기본 감정 분석 (긍정 단어가 있으면 긍정이 우선)
         sentiment = "neutral"
-        for word in negative_words:
-            if word in context_text:
-                sentiment = "negative"
-                break
-        for word in positive_words:
-            if word in context_text:
-                sentiment = "positive"
-                break
+        if any(word in context_text for word in _POSITIVE_WORDS):
+            sentiment = "positive"
+        elif any(word in context_text for word in _NEGATIVE_WORDS):
+            sentiment = "negative"
         
         return {
             "context": context_text,
@@ -116,7 +185,7 @@ class EnhancedKeywordAnalyzer:
     
     def analyze_keyword_relationships(self, product_name: str, keywords: List[str]) -> Dict[str, Any]:
         """키워드들 간의 연관성을 분석합니다."""
-        if not test_ollama_connection():
+        if not self._conn_ok():
             return self._fallback_relationship_analysis(product_name, keywords)
         
         try:
@@ -133,7 +202,7 @@ class EnhancedKeywordAnalyzer:
                 return self._fallback_relationship_analysis(product_name, keywords)
                 
         except Exception as e:
-            print(f"키워드 연관성 분석 오류: {e}")
+            logger.error("키워드 연관성 분석 오류: %s", e)
             return self._fallback_relationship_analysis(product_name, keywords)
     
     def _fallback_relationship_analysis(self, product_name: str, keywords: List[str]) -> Dict[str, Any]:
@@ -143,10 +212,8 @@ class EnhancedKeywordAnalyzer:
         # 의약품 성분 그룹화
         ingredient_keywords = []
         for keyword in keywords:
-            for category, ingredients in self.medical_knowledge_base["active_ingredients"].items():
-                if keyword in ingredients:
-                    ingredient_keywords.append(keyword)
-                    break
+            if keyword in _MEDICAL_KB_INDEX["active_ingredients"]:
+                ingredient_keywords.append(keyword)
         
         if ingredient_keywords:
             keyword_groups.append({
@@ -159,10 +226,8 @@ class EnhancedKeywordAnalyzer:
         # 제형 그룹화
         dosage_form_keywords = []
         for keyword in keywords:
-            for category, forms in self.medical_knowledge_base["dosage_forms"].items():
-                if keyword in forms:
-                    dosage_form_keywords.append(keyword)
-                    break
+            if keyword in _MEDICAL_KB_INDEX["dosage_forms"]:
+                dosage_form_keywords.append(keyword)
         
         if dosage_form_keywords:
             keyword_groups.append({
@@ -175,10 +240,8 @@ class EnhancedKeywordAnalyzer:
         # 용기 그룹화
         container_keywords = []
         for keyword in keywords:
-            for category, containers in self.medical_knowledge_base["containers"].items():
-                if keyword in containers:
-                    container_keywords.append(keyword)
-                    break
+            if keyword in _MEDICAL_KB_INDEX["containers"]:
+                container_keywords.append(keyword)
         
         if container_keywords:
             keyword_groups.append({
@@ -205,9 +268,12 @@ class EnhancedKeywordAnalyzer:
             "미생물학적 특성": []
         }
         
+        # 모든 키워드의 첫 등장 위치를 텍스트 한 번 스캔으로 구함
+        keyword_positions = self._find_first_positions(text, keywords)
+        
         # 각 키워드에 대해 컨텍스트 분석 수행
         for keyword in keywords:
-            context_analysis = self.analyze_keyword_context(text, keyword)
+            context_analysis = self.analyze_keyword_context(text, keyword, keyword_positions.get(keyword))
             
             # 기본 분류 (기존 로직)
             section = self._basic_classify_keyword(keyword)
@@ -229,40 +295,37 @@ class EnhancedKeywordAnalyzer:
         
         return classified_keywords
     
-    def _basic_classify_keyword(self, keyword: str) -> str:
-        """기본 키워드 분류 (기존 로직)"""
-        keyword_lower = keyword.lower()
-        
-        # 제품 기본 정보
-        if any(word in keyword_lower for word in ['제품명', '제형', '정제', '주사제', '캡슐', '시럽', '연고', '크림', '정', '필름코팅정', '경구용', '필름', '코팅']):
-            return "제품 기본 정보"
-        
-        # 외형 정보
-        elif any(word in keyword_lower for word in ['외형', '모양', '색상', '색깔', '흰색', '노란색', '각인', '표시', '마크', '원형', '타원형']):
-            return "외형 정보"
-        
-        # 성분 정보
-        elif any(word in keyword_lower for word in ['성분', '주성분', '첨가제', '결합제', '희석제', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드', '메트포르민', '파세타민', 'USP', 'EP', 'JP', '순도']):
-            return "성분 정보"
-        
-        # 용기 정보
-        elif any(word in keyword_lower for word in ['용기', '포장', '병', '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터', '포일']):
-            return "용기 정보"
-        
-        # 개발 이력
-        elif any(word in keyword_lower for word in ['개발', '연구', '제형개발', '처방개발', '선택근거', '개발근거', '임상', '시험', '제형', '처방', '선택', '근거']):
-            return "개발 이력"
-        
-        # 성능 특성
-        elif any(word in keyword_lower for word in ['용출', '붕해', '생체이용률', '안정성', '성능', '특성', '분해', '용해도', '흡수', '배설', '생체', '이용률', '용해', '안정']):
-            return "성능 특성"
+    def _find_first_positions(self, text: str, keywords: List[str]) -> Dict[str, int]:
+        """Aho-Corasick으로 각 키워드의 첫 등장 시작 위치를 찾습니다 (없으면 -1)."""
+        positions = {}
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            if keyword:
+                positions[keyword] = -1
+                automaton.add_word(keyword, keyword)
+        if not positions:
+            return positions
         
-        # 미생물학적 특성
-        elif any(word in keyword_lower for word in ['보존제', '멸균', '미생물', '무균', '살균', '방부제', '세균', '균', '보존', '멸균', '미생물', '무균', '살균', '방부']):
-            return "미생물학적 특성"
+        automaton.make_automaton()
+        remaining = len(positions)
+        for end_index, keyword in automaton.iter(text):
+            if positions[keyword] == -1:
+                positions[keyword] = end_index - len(keyword) + 1
+                remaining -= 1
+                if remaining == 0:
+                    break
+        return positions
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _basic_classify_keyword(keyword: str) -> str:
+        """기본 키워드 분류 (기존 로직, 키워드별 결과 캐시)"""
+        section = lookup_section(_BASIC_SECTION_AUTOMATON, _BASIC_EXACT_SECTIONS, keyword.lower())
+        if section:
+            return section
         
-        # 함량 정보는 성분 정보에 포함
-        elif any(word in keyword_lower for word in ['mg', 'g', 'ml', 'mcg', '단위', '함량']) or re.search(r'\d+', keyword):
+        # 숫자가 포함된 키워드는 성분 정보 (함량)
+        if _DIGIT_RE.search(keyword):
             return "성분 정보"
         
         # 기본값
@@ -276,70 +339,95 @@ class EnhancedKeywordAnalyzer:
             if not keywords_with_context:
                 continue
             
-            # 신뢰도와 관련성을 고려하여 정렬
-            sorted_keywords = sorted(
-                keywords_with_context,
-                key=lambda x: (
-                    x["context"]["confidence"],
-                    x["context"]["relevance"] == "high",
-                    x["context"]["sentiment"] != "negative"
-                ),
-                reverse=True
-            )
-            
-            # 상위 N개 선택
-            top_keywords[section] = sorted_keywords[:top_n]
+            # 신뢰도와 관련성을 고려하여 상위 N개 선택 (전체 정렬 없이)
+            top_keywords[section] = heapq.nlargest(top_n, keywords_with_context, key=_context_rank)
         
         return top_keywords
     
     def generate_enhanced_sentences(self, product_name: str, top_keywords: Dict[str, List[Dict[str, Any]]]) -> Dict[str, str]:
-        """개선된 프롬프트를 사용한 문장 생성"""
+        """개선된 프롬프트를 사용한 문장 생성 (모든 섹션을 한 번의 LLM 호출로 요청)"""
+        sections = [
+            section for section, keywords_with_context in top_keywords.items()
+            if keywords_with_context and section in IMPROVED_SECTION_PROMPTS
+        ]
+        
         generated_sentences = {}
+        if len(sections) > 1:
+            generated_sentences = self._generate_batch_sentences(product_name, sections, top_keywords)
         
-        for section, keywords_with_context in top_keywords.items():
-            if not keywords_with_context:
+        # 배치 응답에 없는 섹션만 섹션별로 다시 요청
+        for section in sections:
+            if section in generated_sentences:
                 continue
-            
-            try:
-                # 키워드만 추출
-                keywords = [kw["keyword"] for kw in keywords_with_context]
-                
-                # 개선된 프롬프트 사용
-                prompt_template = IMPROVED_SECTION_PROMPTS.get(section, "")
-                if not prompt_template:
-                    continue
-                
-                prompt = prompt_template.format(
-                    product_name=product_name or "정보 없음",
-                    keywords=str(keywords)
+            sentence = self._generate_section_sentence(product_name, section, top_keywords[section])
+            if sentence is not None:
+                generated_sentences[section] = sentence
+        
+        return {section: generated_sentences[section] for section in sections if section in generated_sentences}
+    
+    def _render_section_prompt(self, product_name: str, section: str, keywords_with_context: List[Dict[str, Any]]) -> str:
+        """섹션 프롬프트 템플릿에 제품명과 키워드를 채웁니다."""
+        keywords = [kw["keyword"] for kw in keywords_with_context]
+        return IMPROVED_SECTION_PROMPTS[section].format(
+            product_name=product_name or "정보 없음",
+            keywords=str(keywords)
+        )
+    
+    def _generate_batch_sentences(self, product_name: str, sections: List[str], top_keywords: Dict[str, List[Dict[str, Any]]]) -> Dict[str, str]:
+        """여러 섹션을 하나의 프롬프트로 묶어 요청하고 섹션별 문장을 반환합니다."""
+        try:
+            prompt = BATCH_SECTION_PROMPT_HEADER + "".join(
+                BATCH_SECTION_BLOCK.format(
+                    section=section,
+                    prompt=self._render_section_prompt(product_name, section, top_keywords[section])
                 )
-                
-                # LLM 호출
-                result = generate_overview_with_llm(prompt, "")
-                
-                # 결과 파싱
-                if isinstance(result, dict):
-                    if section in result:
-                        generated_sentences[section] = result[section]
-                    else:
-                        # 다른 형태의 JSON 응답 처리
-                        for key, value in result.items():
-                            if isinstance(value, str):
-                                generated_sentences[section] = value
-                                break
-                elif isinstance(result, str):
-                    try:
-                        parsed = json.loads(result)
-                        if section in parsed:
-                            generated_sentences[section] = parsed[section]
-                        else:
-                            generated_sentences[section] = f"이 제품의 {section}에 대한 정보가 있습니다."
-                    except json.JSONDecodeError:
-                        generated_sentences[section] = result
-                
-            except Exception as e:
-                print(f"개선된 문장 생성 오류 ({section}): {e}")
-                keywords_str = ", ".join([kw["keyword"] for kw in keywords_with_context])
-                generated_sentences[section] = f"이 제품의 {section}에 대한 정보가 있습니다. 주요 키워드: {keywords_str}"
+                for section in sections
+            )
+            
+            result = generate_overview_with_llm(prompt, "")
+            if isinstance(result, str):
+                result = orjson.loads(result)
+            if not isinstance(result, dict):
+                return {}
+            
+            return {
+                section: result[section]
+                for section in sections
+                if isinstance(result.get(section), str)
+            }
+        
+        except Exception as e:
+            logger.error("배치 문장 생성 오류: %s", e)
+            return {}
+    
+    def _generate_section_sentence(self, product_name: str, section: str, keywords_with_context: List[Dict[str, Any]]) -> Optional[str]:
+        """한 섹션에 대한 문장 생성"""
+        try:
+            prompt = self._render_section_prompt(product_name, section, keywords_with_context)
+            
+            # LLM 호출
+            result = generate_overview_with_llm(prompt, "")
+            
+            # 결과 파싱
+            if isinstance(result, dict):
+                if section in result:
+                    return result[section]
+                # 다른 형태의 JSON 응답 처리
+                for key, value in result.items():
+                    if isinstance(value, str):
+                        return value
+            elif isinstance(result, str):
+                try:
+                    parsed = json.loads(result)
+                    if section in parsed:
+                        return parsed[section]
+                    return f"이 제품의 {section}에 대한 정보가 있습니다."
+                except json.JSONDecodeError:
+                    return result
+            
+        except Exception as e:
+            logger.error("개선된 문장 생성 오류 (%s): %s", section, e)
+            keywords_str = ", ".join([kw["keyword"] for kw in keywords_with_context])
+            return f"이 제품의 {section}에 대한 정보가 있습니다. 주요 키워드: {keywords_str}"
         
-        return generated_sentences 
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -213,4 +213,18 @@ KEYWORD_RELATIONSHIP_PROMPT = """당신은 의약품 키워드 연관성 분석
     }}
   ],
   "overall_analysis": "전체 키워드 분석 결과"
-}}""" 
\ No newline at end of file
+}}""" 
+
+# 여러 섹션을 한 번에 요청하는 배치 프롬프트
+BATCH_SECTION_PROMPT_HEADER = """당신은 의약품 전문가입니다. 아래의 각 SECTION을 해당 지침에 따라 분석해주세요.
+
+**응답 형식:**
+각 SECTION의 개별 JSON 형식 대신, SECTION 이름을 키로 하고 분석된 설명을 값으로 하는 하나의 JSON 객체로만 응답하세요.
+예: {"제품 기본 정보": "분석된 제품 기본 정보 설명", "성분 정보": "분석된 성분 정보 설명"}
+
+"""
+
+BATCH_SECTION_BLOCK = """### SECTION: {section}
+{prompt}
+
+"""
\ No newline at end of file
@@ -1,100 +1,144 @@
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional, Sequence
 import re
+import functools
+import ahocorasick
+import numpy as np
 from collections import Counter
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
+
+_NUMBER_UNIT_RE = re.compile(r'\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위|정|캡슐|주사제)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_DIGIT_RE = re.compile(r'\d')
+_SPECIAL_CHAR_RE = re.compile(r'[^\w\s]')
+
+# 각 패턴은 캡처 그룹이 하나씩이므로 하나로 합친 정규식에서 m.lastindex가 매칭된 패턴의 그룹을 가리킴
+_MEDICAL_PATTERN_SOURCES = [
+    r'\b\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위)\b',
+    r'\b(정제|주사제|캡슐|시럽|연고|크림|액제|분말|과립|정|필름코팅정)\b',
+    r'\b(아세트아미노펜|이부프로펜|아스피린|세마글루타이드|메트포르민|글리메피리드|파세타민)\b',
+    r'\b(USP|EP|JP|순도|함량|성분|주성분|첨가제|결합제|희석제)\b',
+    r'\b(용기|포장|병|앰플|바이알|플라스틱|유리|알루미늄|블리스터|포일)\b',
+    r'\b(용출|붕해|생체이용률|안정성|성능|특성|분해|용해도)\b',
+    r'\b(보존제|멸균|미생물|무균|살균|방부제)\b',
+    r'\b(개발|연구|제형개발|처방개발|선택근거|개발근거)\b',
+    r'\b(외형|모양|색상|색깔|흰색|노란색|각인|표시|마크)\b',
+    r'\b(경구용|주사용|외용|내용|투여|복용)\b',
+]
+_MEDICAL_RE = re.compile('|'.join(_MEDICAL_PATTERN_SOURCES), re.IGNORECASE)
+
+_COMMON_WORDS = [
+    '제품명', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
+    '안정성', '보존제', '멸균', '개발', '연구', '특성', '성능', '외형',
+    '투여', '복용', '경구', '주사', '외용', '내용'
+]
+
+_SECTION_WORDS = [
+    ("dosage_form", ['정제', '주사제', '캡슐', '시럽', '연고', '크림', '정', '필름코팅정', '경구용']),
+    ("strength", ['mg', 'g', 'ml', 'mcg', '단위', '함량']),
+    ("appearance", ['외형', '모양', '색상', '색깔', '흰색', '노란색', '각인', '표시', '마크']),
+    ("composition", ['성분', '주성분', '첨가제', '결합제', '희석제', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드', '메트포르민', '파세타민']),
+    ("container", ['용기', '포장', '병', '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터', '포일']),
+    ("development", ['개발', '연구', '제형개발', '처방개발', '선택근거', '개발근거']),
+    ("performance", ['용출', '붕해', '생체이용률', '안정성', '성능', '특성', '분해', '용해도']),
+    ("microbiological", ['보존제', '멸균', '미생물', '무균', '살균', '방부제']),
+]
+
+def build_section_automaton(section_words: Sequence[Tuple[str, List[str]]]) -> ahocorasick.Automaton:
+    """(섹션, 단어 목록) 순서대로 우선순위를 매겨 Aho-Corasick 오토마톤을 만듭니다."""
+    automaton = ahocorasick.Automaton()
+    for priority, (section, words) in enumerate(section_words):
+        for word in words:
+            # 여러 섹션에 속한 단어는 먼저 나온(우선순위가 높은) 섹션을 따름
+            if word not in automaton:
+                automaton.add_word(word, (priority, section))
+    automaton.make_automaton()
+    return automaton
+
+def match_section(automaton: ahocorasick.Automaton, text: str) -> Optional[str]:
+    """text에 포함된 단어 중 우선순위가 가장 높은 섹션을 반환합니다."""
+    best = min((value for _, value in automaton.iter(text)), default=None)
+    return best[1] if best else None
+
+def build_exact_section_index(automaton: ahocorasick.Automaton, section_words: Sequence[Tuple[str, List[str]]]) -> Dict[str, Optional[str]]:
+    """목록에 있는 단어 자체가 키워드일 때의 분류 결과를 미리 계산해 해시 조회로 바로 찾게 합니다."""
+    index = {}
+    for _, words in section_words:
+        for word in words:
+            word_lower = word.lower()
+            index[word_lower] = match_section(automaton, word_lower)
+    return index
+
+def lookup_section(automaton: ahocorasick.Automaton, exact_index: Dict[str, Optional[str]], text: str) -> Optional[str]:
+    """정확히 일치하는 단어는 사전에서, 나머지는 오토마톤 스캔으로 섹션을 찾습니다."""
+    if text in exact_index:
+        return exact_index[text]
+    return match_section(automaton, text)
+
+_SECTION_AUTOMATON = build_section_automaton(_SECTION_WORDS)
+_EXACT_SECTIONS = build_exact_section_index(_SECTION_AUTOMATON, _SECTION_WORDS)
 
 def tokenize_product_name(product_name: str) -> List[str]:
     if not product_name:
         return []
+    # 캐시된 튜플을 그대로 내주지 않고 호출마다 새 리스트를 반환
+    return list(_tokenize_product_name_cached(product_name))
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize_product_name_cached(product_name: str) -> Tuple[str, ...]:
     tokens = []
-    number_unit_pattern = r'\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위|정|캡슐|주사제)'
-    number_units = re.findall(number_unit_pattern, product_name, re.IGNORECASE)
-    remaining_text = re.sub(number_unit_pattern, '', product_name, flags=re.IGNORECASE)
-    remaining_tokens = re.split(r'\s+', remaining_text.strip())
+    number_units = _NUMBER_UNIT_RE.findall(product_name)
+    remaining_text = _NUMBER_UNIT_RE.sub('', product_name)
+    remaining_tokens = _WHITESPACE_RE.split(remaining_text.strip())
     tokens.extend(remaining_tokens)
     tokens.extend(number_units)
-    tokens = [token.strip() for token in tokens if token.strip()]
-    return tokens
+    return tuple(token.strip() for token in tokens if token.strip())
 
-def extract_medical_keywords_from_text(text: str) -> List[str]:
-    medical_patterns = [
-        r'\b\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위)\b',
-        r'\b(정제|주사제|캡슐|시럽|연고|크림|액제|분말|과립|정|필름코팅정)\b',
-        r'\b(아세트아미노펜|이부프로펜|아스피린|세마글루타이드|메트포르민|글리메피리드|파세타민)\b',
-        r'\b(USP|EP|JP|순도|함량|성분|주성분|첨가제|결합제|희석제)\b',
-        r'\b(용기|포장|병|앰플|바이알|플라스틱|유리|알루미늄|블리스터|포일)\b',
-        r'\b(용출|붕해|생체이용률|안정성|성능|특성|분해|용해도)\b',
-        r'\b(보존제|멸균|미생물|무균|살균|방부제)\b',
-        r'\b(개발|연구|제형개발|처방개발|선택근거|개발근거)\b',
-        r'\b(외형|모양|색상|색깔|흰색|노란색|각인|표시|마크)\b',
-        r'\b(경구용|주사용|외용|내용|투여|복용)\b',
-    ]
-    keywords = []
-    for pattern in medical_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        keywords.extend(matches)
-    common_words = [
-        '제품명', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
-        '안정성', '보존제', '멸균', '개발', '연구', '특성', '성능', '외형',
-        '투여', '복용', '경구', '주사', '외용', '내용'
-    ]
-    for word in common_words:
+def count_medical_keywords(text: str) -> Counter:
+    """텍스트의 의약품 키워드와 등장 빈도를 한 번에 셉니다 (calculate_keyword_weights의 keyword_frequency로 사용 가능)."""
+    keyword_frequency = Counter()
+    keyword_frequency.update(match.group(match.lastindex).strip() for match in _MEDICAL_RE.finditer(text))
+    for word in _COMMON_WORDS:
         if word in text:
-            keywords.append(word)
-    unique_keywords = list(set(keywords))
-    return [kw.strip() for kw in unique_keywords if len(kw.strip()) >= 2]
+            keyword_frequency[word] += 1
+    return keyword_frequency
+
+def extract_medical_keywords_from_text(text: str) -> List[str]:
+    return [kw for kw in count_medical_keywords(text) if len(kw) >= 2]
+
+def _classify_keyword(keyword: str, keyword_lower: str) -> Optional[str]:
+    section = lookup_section(_SECTION_AUTOMATON, _EXACT_SECTIONS, keyword_lower)
+    if section != "dosage_form" and _DIGIT_RE.search(keyword):
+        section = "strength"
+    return section
 
 def classify_keywords_by_section(keywords: List[str]) -> Dict[str, List[str]]:
-    section_keywords = {
-        "dosage_form": [],
-        "strength": [],
-        "appearance": [],
-        "composition": [],
-        "container": [],
-        "development": [],
-        "performance": [],
-        "microbiological": []
-    }
+    section_keywords = {section: [] for section, _ in _SECTION_WORDS}
     for keyword in keywords:
-        keyword_lower = keyword.lower()
-        if any(word in keyword_lower for word in ['정제', '주사제', '캡슐', '시럽', '연고', '크림', '정', '필름코팅정', '경구용']):
-            section_keywords["dosage_form"].append(keyword)
-        elif any(word in keyword_lower for word in ['mg', 'g', 'ml', 'mcg', '단위', '함량']) or re.search(r'\d+', keyword):
-            section_keywords["strength"].append(keyword)
-        elif any(word in keyword_lower for word in ['외형', '모양', '색상', '색깔', '흰색', '노란색', '각인', '표시', '마크']):
-            section_keywords["appearance"].append(keyword)
-        elif any(word in keyword_lower for word in ['성분', '주성분', '첨가제', '결합제', '희석제', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드', '메트포르민', '파세타민']):
-            section_keywords["composition"].append(keyword)
-        elif any(word in keyword_lower for word in ['용기', '포장', '병', '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터', '포일']):
-            section_keywords["container"].append(keyword)
-        elif any(word in keyword_lower for word in ['개발', '연구', '제형개발', '처방개발', '선택근거', '개발근거']):
-            section_keywords["development"].append(keyword)
-        elif any(word in keyword_lower for word in ['용출', '붕해', '생체이용률', '안정성', '성능', '특성', '분해', '용해도']):
-            section_keywords["performance"].append(keyword)
-        elif any(word in keyword_lower for word in ['보존제', '멸균', '미생물', '무균', '살균', '방부제']):
-            section_keywords["microbiological"].append(keyword)
+        section = _classify_keyword(keyword, keyword.lower())
+        if section:
+            section_keywords[section].append(keyword)
     return section_keywords
 
 def calculate_keyword_weights(keywords: List[str], product_tokens: List[str], keyword_frequency: Dict[str, int]) -> List[Tuple[str, float]]:
-    keyword_weights = []
-    for keyword in keywords:
-        weight = 0.0
-        frequency = keyword_frequency.get(keyword, 1)
-        frequency_score = min(frequency * 0.2, 0.4)
-        similarity_score = 0.0
-        for token in product_tokens:
-            similarity = SequenceMatcher(None, keyword.lower(), token.lower()).ratio()
-            similarity_score = max(similarity_score, similarity)
-        similarity_score *= 0.4
-        length_score = 0.0
-        if len(keyword) >= 3:
-            has_number = bool(re.search(r'\d', keyword))
-            has_special = bool(re.search(r'[^\w\s]', keyword))
-            length_score = (0.5 + 0.3 * has_number + 0.2 * has_special) * 0.2
-        weight = frequency_score + similarity_score + length_score
-        keyword_weights.append((keyword, weight))
-    keyword_weights.sort(key=lambda x: x[1], reverse=True)
-    return keyword_weights
+    if not keywords:
+        return []
+    # 점수 항목별로 배열을 만들어 한 번에 계산 (빈도, 제품명 유사도, 길이 점수의 합)
+    frequencies = np.fromiter((keyword_frequency.get(keyword, 1) for keyword in keywords), dtype=np.float64, count=len(keywords))
+    frequency_scores = np.minimum(frequencies * 0.2, 0.4)
+    product_tokens_lower = [token.lower() for token in product_tokens]
+    if product_tokens_lower:
+        similarity_matrix = process.cdist([keyword.lower() for keyword in keywords], product_tokens_lower, scorer=fuzz.ratio, dtype=np.float64)
+        similarity_scores = similarity_matrix.max(axis=1) / 100.0 * 0.4
+    else:
+        similarity_scores = np.zeros(len(keywords))
+    long_enough = np.fromiter((len(keyword) >= 3 for keyword in keywords), dtype=bool, count=len(keywords))
+    has_number = np.fromiter((bool(_DIGIT_RE.search(keyword)) for keyword in keywords), dtype=bool, count=len(keywords))
+    has_special = np.fromiter((bool(_SPECIAL_CHAR_RE.search(keyword)) for keyword in keywords), dtype=bool, count=len(keywords))
+    length_scores = np.where(long_enough, (0.5 + 0.3 * has_number + 0.2 * has_special) * 0.2, 0.0)
+    weights = frequency_scores + similarity_scores + length_scores
+    # 가중치 내림차순, 같은 가중치는 입력 순서 유지
+    order = np.argsort(-weights, kind='stable')
+    return [(keywords[i], weight) for i, weight in zip(order.tolist(), weights[order].tolist())]
 
 def get_top_keywords_by_section(section_keywords: Dict[str, List[str]], product_tokens: List[str], keyword_frequency: Dict[str, int], top_n: int = 3) -> Dict[str, List[str]]:
     top_keywords = {}
@@ -104,4 +148,4 @@ def get_top_keywords_by_section(section_keywords: Dict[str, List[str]], product_
         keyword_weights = calculate_keyword_weights(keywords, product_tokens, keyword_frequency)
         top_n_keywords = [kw for kw, weight in keyword_weights[:top_n]]
         top_keywords[section] = top_n_keywords
-    return top_keywords 
\ No newline at end of file
+    return top_keywords
\ No newline at end of file
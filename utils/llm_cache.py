@@ -0,0 +1,76 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+def _open_cache(path: str) -> sqlite3.Connection:
+    """캐시 DB를 열고 테이블을 준비합니다 (여러 스레드가 하나의 연결을 공유)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    connection.commit()
+    return connection
+
+def llm_cache(path: str = "~/.cache/mpos_llm.sqlite", salt: str = "") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """LLM 응답을 파싱해 내용을 돌려주는 함수의 결과를 디스크(sqlite)에 캐시합니다.
+
+    키는 함수 이름, salt(모델 태그와 생성 설정 등), 인자(JSON 직렬화)의 blake2b 해시이고,
+    값은 반환값을 JSON으로 저장합니다. salt가 바뀌면 이전 설정의 결과는 다시 쓰지 않습니다.
+    예외로 끝난 호출(오류, 쓸 수 없는 응답)은 저장하지 않으므로 다음 실행에서 다시 시도합니다.
+    캐시 DB를 쓸 수 없으면 캐시 없이 원래 함수를 호출합니다.
+    """
+    path = os.path.expanduser(path)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        lock = threading.Lock()
+        state = {"connection": None, "disabled": False}
+
+        def get_connection():
+            if state["connection"] is None and not state["disabled"]:
+                try:
+                    state["connection"] = _open_cache(path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.warning("LLM 캐시를 열 수 없어 캐시 없이 진행합니다 (%s): %s", path, e)
+                    state["disabled"] = True
+            return state["connection"]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            key_source = json.dumps([func.__qualname__, salt, args], ensure_ascii=False, sort_keys=True)
+            key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+            with lock:
+                connection = get_connection()
+                if connection is not None:
+                    try:
+                        row = connection.execute("SELECT value FROM results WHERE key=?", (key,)).fetchone()
+                    except sqlite3.Error as e:
+                        logger.warning("LLM 캐시 조회 오류: %s", e)
+                        row = None
+                    if row is not None:
+                        return json.loads(row[0])
+
+            # 캐시에 없으면 LLM 호출 (잠금 밖에서 호출해 동시 요청을 막지 않음, 예외는 그대로 전달)
+            result = func(*args)
+
+            with lock:
+                if connection is not None:
+                    try:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                            (key, json.dumps(result, ensure_ascii=False))
+                        )
+                        connection.commit()
+                    except sqlite3.Error as e:
+                        logger.warning("LLM 캐시 저장 오류: %s", e)
+            return result
+
+        return wrapper
+
+    return decorator
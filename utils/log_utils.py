@@ -0,0 +1,42 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+
+# 진행 로그를 내보내는 패키지 로거 (utils.text_processor 등은 이 로거의 하위 로거)
+_PACKAGE_LOGGER = "utils"
+
+_listener = None
+_listener_lock = threading.Lock()
+
+def _root_unconfigured(record: logging.LogRecord) -> bool:
+    """루트 로거에 핸들러가 없을 때만 통과시켜, 앱이 로깅을 설정한 뒤에는 앱 핸들러로만 출력되게 합니다."""
+    return not logging.getLogger().handlers
+
+def setup_queue_logging(level: int = logging.INFO) -> None:
+    """패키지 로거의 로그를 큐로 넘기고 별도 스레드에서 출력하도록 설정합니다.
+
+    LLM 호출 경로가 stdout(파이프, 도커 로그 등) 쓰기에서 막히지 않도록 합니다.
+    출력 스레드를 시작하므로 라이브러리 import 시점이 아니라 앱 시작 부분(app.py)에서 한 번 호출합니다.
+    루트 로거와 그 레벨은 바꾸지 않으며, 앱이 루트 로거에 핸들러를 달면 이 핸들러는 출력하지 않습니다.
+    패키지 로거에 이미 레벨이 지정되어 있으면 그대로 둡니다.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(_root_unconfigured)
+        package_logger = logging.getLogger(_PACKAGE_LOGGER)
+        package_logger.addHandler(queue_handler)
+        if package_logger.level == logging.NOTSET:
+            package_logger.setLevel(level)
@@ -11,55 +11,128 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
 from reportlab.lib.colors import HexColor, black, white
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.platypus.flowables import HRFlowable
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak
+from reportlab.platypus.flowables import Flowable, HRFlowable
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+import io
 import os
+import logging
+import functools
+
+logger = logging.getLogger(__name__)
+
+# 한국어 폰트 후보 경로 (Windows 기본 폰트 우선, 앞에 있는 경로가 우선)
+_KOREAN_FONT_PATHS = (
+    'C:/Windows/Fonts/malgun.ttf',
+    'C:/Windows/Fonts/malgun.ttc',
+    'C:/Windows/Fonts/gulim.ttc',
+    'C:/Windows/Fonts/batang.ttc',
+    'malgun.ttf',
+    'malgun.ttc',
+    'gulim.ttc',
+    'batang.ttc'
+)
+
+# 비어 있는 항목 표시
+_NO_INFO = "정보 없음"
+
+# 섹션 구분선 색상
+_DIVIDER_COLOR = HexColor('#cccccc')
+
+# 원형 번호 (10개까지, 이후는 "11." 형식)
+_CIRCLED_NUMBERS = ('①', '②', '③', '④', '⑤', '⑥', '⑦', '⑧', '⑨', '⑩')
+
+def _is_valid(value: Any) -> bool:
+    """출력할 값인지 확인합니다 (빈 값과 "정보 없음" 제외).
+
+    목록/딕셔너리 값도 오므로 frozenset 대신 직접 비교합니다.
+    """
+    return bool(value) and value != _NO_INFO
+
+@functools.lru_cache(maxsize=32)
+def _section_heading_text(number: int, title: str) -> str:
+    """섹션 제목 문자열을 캐시합니다.
+
+    Paragraph는 빌드 중 레이아웃 상태를 저장하고 생성기는 여러 스레드에서 공유될 수 있으므로
+    인스턴스 대신 문자열만 캐시하고 Paragraph는 빌드마다 새로 만듭니다.
+    """
+    return f"{number} {title}"
+
+@functools.lru_cache(maxsize=1)
+def _resolve_korean_font() -> str:
+    """사용할 한국어 폰트를 한 번만 찾아 등록하고 폰트 이름을 반환합니다.
+
+    ReportLab 폰트 등록은 프로세스 전역이므로 결과를 캐시해 재사용합니다.
+    """
+    for font_path in _KOREAN_FONT_PATHS:
+        if not os.path.exists(font_path):
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont('KoreanFont', font_path))
+            logger.info("✅ 한국어 폰트 로드 성공: %s", font_path)
+            return 'KoreanFont'
+        except Exception as e:
+            logger.warning("폰트 로드 실패 %s: %s", font_path, e)
+    
+    # 폰트가 없으면 기본 폰트 사용
+    logger.warning("⚠️ 한국어 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
+    return 'Helvetica'
+
+# 페이지 여백
+_PAGE_MARGIN = 20*mm
+
+# 개요서 섹션 (번호, 섹션명, 처리 방식) - 처리 방식은 MedicalPDFExporter._emit_<kind>
+_SECTIONS = (
+    (1, '작용기전', 'dict_of_text'),
+    (2, '주요 적응증 및 제품명', 'dict_of_list_or_text'),
+    (3, '성분 및 함량', 'composition'),
+    (4, '성상', 'text'),
+    (5, '효능 및 효과', 'list'),
+    (6, '용법 및 용량', 'usage'),
+    (7, '사용상 주의사항', 'precaution'),
+    (8, '상호작용', 'list'),
+    (9, '임부 및 수유부 사용', 'dict_of_text'),
+    (10, '고령자 사용', 'text'),
+    (11, '적용 시 주의사항', 'list'),
+    (12, '보관 및 취급', 'storage'),
+    (13, '제조 및 판매사 정보', 'dict_of_text'),
+)
 
 class MedicalPDFExporter:
     """의약품 개요서 PDF 생성기"""
     
     def __init__(self):
         self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        # 스타일에 한국어 폰트를 지정하므로 폰트를 먼저 설정
         self._setup_korean_font()
+        self._setup_custom_styles()
+        self._setup_page_templates()
     
     def _setup_korean_font(self):
         """한국어 폰트 설정"""
-        try:
-            # Windows 기본 폰트 사용 (여러 경로 시도)
-            font_paths = [
-                'C:/Windows/Fonts/malgun.ttf',
-                'C:/Windows/Fonts/malgun.ttc',
-                'C:/Windows/Fonts/gulim.ttc',
-                'C:/Windows/Fonts/batang.ttc',
-                'malgun.ttf',
-                'malgun.ttc',
-                'gulim.ttc',
-                'batang.ttc'
-            ]
-            
-            for font_path in font_paths:
-                try:
-                    if os.path.exists(font_path):
-                        pdfmetrics.registerFont(TTFont('KoreanFont', font_path))
-                        self.korean_font = 'KoreanFont'
-                        print(f"✅ 한국어 폰트 로드 성공: {font_path}")
-                        return
-                except Exception as e:
-                    print(f"폰트 로드 실패 {font_path}: {e}")
-                    continue
-            
-            # 폰트가 없으면 기본 폰트 사용
-            self.korean_font = 'Helvetica'
-            print("⚠️ 한국어 폰트를 찾을 수 없어 기본 폰트를 사용합니다.")
-            
-        except Exception as e:
-            print(f"⚠️ 폰트 설정 오류: {e}")
-            self.korean_font = 'Helvetica'
+        self.korean_font = _resolve_korean_font()
+    
+    def _setup_page_templates(self):
+        """페이지 템플릿 설정 (본문 Frame의 위치와 크기만 한 번 계산)"""
+        self._frame_geometry = (
+            _PAGE_MARGIN,
+            _PAGE_MARGIN,
+            A4[0] - 2 * _PAGE_MARGIN,
+            A4[1] - 2 * _PAGE_MARGIN,
+        )
+    
+    def _new_page_templates(self) -> List[PageTemplate]:
+        """문서마다 새 Frame/PageTemplate을 만듭니다.
+
+        Frame은 빌드 중 배치 상태를 가지므로, 공유 생성기로 여러 스레드가 동시에 빌드해도
+        서로 영향을 주지 않도록 문서마다 따로 생성합니다.
+        """
+        frame = Frame(*self._frame_geometry, id='normal')
+        return [PageTemplate(id='main', frames=[frame], pagesize=A4)]
     
     def _setup_custom_styles(self):
         """커스텀 스타일 설정"""
@@ -76,7 +149,7 @@ class MedicalPDFExporter:
                 spaceBefore=12,
                 leftIndent=0,
                 rightIndent=0,
-                fontName='Helvetica-Bold'
+                fontName=self.korean_font
             ))
         
         # 메인 섹션 제목 스타일 (파란색 박스 + 번호)
@@ -90,7 +163,7 @@ class MedicalPDFExporter:
                 spaceAfter=8,
                 spaceBefore=16,
                 leftIndent=0,
-                fontName='Helvetica-Bold'
+                fontName=self.korean_font
             ))
         
         # 서브 섹션 제목 스타일 (1-1, 1-2 등)
@@ -104,7 +177,7 @@ class MedicalPDFExporter:
                 spaceAfter=6,
                 spaceBefore=12,
                 leftIndent=10,
-                fontName='Helvetica-Bold'
+                fontName=self.korean_font
             ))
         
         # 본문 스타일 (기존 BodyText가 있으므로 MedicalBodyText로 변경)
@@ -118,7 +191,7 @@ class MedicalPDFExporter:
                 spaceAfter=6,
                 spaceBefore=6,
                 leftIndent=20,
-                fontName='Helvetica'
+                fontName=self.korean_font
             ))
         
         # 리스트 스타일
@@ -132,56 +205,97 @@ class MedicalPDFExporter:
                 spaceAfter=4,
                 spaceBefore=4,
                 leftIndent=30,
-                fontName='Helvetica'
+                fontName=self.korean_font
             ))
+        
+        # 세부 항목 스타일 (규격, 기준 등)
+        if 'MedicalDetailText' not in self.styles:
+            self.styles.add(ParagraphStyle(
+                name='MedicalDetailText',
+                parent=self.styles['Normal'],
+                fontSize=11,
+                textColor=black,
+                alignment=TA_LEFT,
+                spaceAfter=4,
+                spaceBefore=4,
+                leftIndent=20,
+                fontName=self.korean_font
+            ))
+        
+        # 페이지 번호 스타일
+        if 'PageNumber' not in self.styles:
+            self.styles.add(ParagraphStyle(
+                name='PageNumber',
+                parent=self.styles['Normal'],
+                fontSize=10,
+                alignment=TA_CENTER,
+                fontName=self.korean_font
+            ))
+        
+        # StyleSheet1.__getitem__는 파이썬 레벨 조회이므로 Paragraph마다 거치지 않도록 속성에 바인딩
+        self._blue_header_style = self.styles['BlueHeader']
+        self._section_style = self.styles['MainSection']
+        self._subsection_style = self.styles['SubSection']
+        self._body_style = self.styles['MedicalBodyText']
+        self._list_style = self.styles['MedicalListText']
+        self._detail_style = self.styles['MedicalDetailText']
+        self._page_number_style = self.styles['PageNumber']
     
     def create_blue_header_box(self, title: str) -> Paragraph:
         """파란색 헤더 박스 생성 (참고 이미지 스타일)"""
-        return Paragraph(f'<para backColor="#1f4e79" textColor="white" alignment="center" fontSize="18" fontName="{self.korean_font}" spaceAfter="12" spaceBefore="12">{title}</para>', self.styles['Normal'])
+        return Paragraph(str(title), self._blue_header_style)
     
     def create_section_with_number(self, number: int, title: str) -> Paragraph:
         """번호가 있는 섹션 제목 생성"""
-        return Paragraph(f'<para fontSize="16" fontName="{self.korean_font}" spaceAfter="8" spaceBefore="16">{number} {title}</para>', self.styles['Normal'])
+        return Paragraph(_section_heading_text(number, title), self._section_style)
     
     def create_subsection_with_number(self, main_num: int, sub_num: int, title: str) -> Paragraph:
         """서브 섹션 제목 생성 (1-1, 1-2 등)"""
-        return Paragraph(f'<para fontSize="14" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="12" leftIndent="10">{main_num}-{sub_num}. {title}</para>', self.styles['Normal'])
+        return Paragraph(f"{main_num}-{sub_num}. {title}", self._subsection_style)
+    
+    def _make_divider(self) -> HRFlowable:
+        """섹션 구분선 생성 (빌드 중 상태가 바뀔 수 있어 매번 새로 생성, 색상만 공유)"""
+        return HRFlowable(width="100%", thickness=1, color=_DIVIDER_COLOR)
     
     def create_list_item(self, number: int, text: str) -> Paragraph:
         """번호가 있는 리스트 아이템 생성"""
-        return Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="30">{number}. {text}</para>', self.styles['Normal'])
+        return Paragraph(f"{number}. {text}", self._list_style)
     
     def create_circled_list_item(self, number: int, text: str) -> Paragraph:
         """원형 번호가 있는 리스트 아이템 생성 (①, ② 등)"""
-        circled_numbers = ['①', '②', '③', '④', '⑤', '⑥', '⑦', '⑧', '⑨', '⑩']
-        circled_num = circled_numbers[number - 1] if number <= len(circled_numbers) else f"{number}."
-        return Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="30">{circled_num} {text}</para>', self.styles['Normal'])
+        circled_num = _CIRCLED_NUMBERS[number - 1] if 1 <= number <= len(_CIRCLED_NUMBERS) else f"{number}."
+        return Paragraph(f"{circled_num} {text}", self._list_style)
     
     def export_overview_to_pdf(self, data: Dict[str, Any], output_path: str) -> str:
         """의약품 개요서를 PDF로 내보내기 (최적화된 버전)"""
         try:
-            print("📄 PDF 생성 시작...")
+            logger.debug("📄 PDF 생성 시작...")
             
-            doc = SimpleDocTemplate(
-                output_path,
+            # 메모리에 빌드한 뒤 파일에는 한 번에 기록
+            buffer = io.BytesIO()
+            doc = BaseDocTemplate(
+                buffer,
                 pagesize=A4,
-                rightMargin=20*mm,
-                leftMargin=20*mm,
-                topMargin=20*mm,
-                bottomMargin=20*mm
+                rightMargin=_PAGE_MARGIN,
+                leftMargin=_PAGE_MARGIN,
+                topMargin=_PAGE_MARGIN,
+                bottomMargin=_PAGE_MARGIN,
+                pageTemplates=self._new_page_templates()
             )
             
             # 배치 처리를 위한 스토리 구성
             story = self._build_pdf_content(data)
             
-            print("📄 PDF 빌드 중...")
+            logger.debug("📄 PDF 빌드 중...")
             doc.build(story)
+            with open(output_path, 'wb') as f:
+                f.write(buffer.getbuffer())
             
-            print(f"✅ PDF 생성 완료: {output_path}")
+            logger.info("✅ PDF 생성 완료: %s", output_path)
             return output_path
             
         except Exception as e:
-            print(f"PDF 생성 오류: {e}")
+            logger.error("PDF 생성 오류: %s", e)
             return ""
     
     def _build_pdf_content(self, data: Dict[str, Any]) -> List:
@@ -194,75 +308,73 @@ class MedicalPDFExporter:
         story.append(Spacer(1, 20))
         
         # 섹션별 배치 처리
-        sections = [
-            ('작용기전', self._process_mechanism_section),
-            ('주요 적응증 및 제품명', self._process_indication_section),
-            ('성분 및 함량', self._process_composition_section),
-            ('성상', self._process_appearance_section),
-            ('효능 및 효과', self._process_effect_section),
-            ('용법 및 용량', self._process_usage_section),
-            ('사용상 주의사항', self._process_precaution_section),
-            ('상호작용', self._process_interaction_section),
-            ('임부 및 수유부 사용', self._process_pregnancy_section),
-            ('고령자 사용', self._process_elderly_section),
-            ('적용 시 주의사항', self._process_caution_section),
-            ('보관 및 취급', self._process_storage_section),
-            ('제조 및 판매사 정보', self._process_company_section)
-        ]
-        
-        for section_name, processor in sections:
-            if section_name in data and data[section_name]:
-                story.extend(processor(data[section_name], section_name))
+        for number, section_name, kind in _SECTIONS:
+            value = data.get(section_name)
+            if value:
+                emit = getattr(self, f"_emit_{kind}")
+                story.extend(emit(number, section_name, value))
         
         # 페이지 번호 추가
         story.append(Spacer(1, 30))
-        story.append(Paragraph(f'<para alignment="center" fontSize="10" fontName="{self.korean_font}">- 1 -</para>', self.styles['Normal']))
+        story.append(Paragraph("- 1 -", self._page_number_style))
         
         return story
     
-    def _process_mechanism_section(self, data: Dict[str, Any], section_name: str) -> List:
-        """작용기전 섹션 처리"""
-        story = []
-        story.append(self.create_section_with_number(1, "작용기전"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_header(self, number: int, title: str) -> List:
+        """섹션 머리 (간격, 번호 제목, 구분선)"""
+        heading = [self.create_section_with_number(number, title), self._make_divider()]
+        # 첫 섹션은 제품명 헤더 뒤의 간격을 그대로 사용
+        if number == 1:
+            return heading
+        return [Spacer(1, 20), *heading]
+    
+    def _emit_text(self, number: int, title: str, data: str) -> Iterator[Flowable]:
+        """문자열 섹션 (성상, 고령자 사용)"""
+        if not _is_valid(data):
+            return
+        yield from self._emit_header(number, title)
+        yield Paragraph(str(data), self._body_style)
+    
+    def _emit_list(self, number: int, title: str, data: List[str]) -> Iterator[Flowable]:
+        """번호 목록 섹션 (효능 및 효과, 상호작용, 적용 시 주의사항)"""
+        yield from self._emit_header(number, title)
+        yield from (
+            self.create_list_item(i, item)
+            for i, item in enumerate(filter(_is_valid, data), 1)
+        )
+    
+    def _emit_dict_of_text(self, number: int, title: str, data: Dict[str, Any]) -> Iterator[Flowable]:
+        """항목별 본문 섹션 (작용기전, 임부 및 수유부 사용, 제조 및 판매사 정보)"""
+        yield from self._emit_header(number, title)
         
         sub_num = 1
         for key, value in data.items():
-            if value and value != "정보 없음":
-                story.append(self.create_subsection_with_number(1, sub_num, key))
-                story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{value}</para>', self.styles['Normal']))
+            if _is_valid(value):
+                yield self.create_subsection_with_number(number, sub_num, key)
+                yield Paragraph(str(value), self._body_style)
                 sub_num += 1
-        
-        return story
     
-    def _process_indication_section(self, data: Dict[str, Any], section_name: str) -> List:
-        """주요 적응증 및 제품명 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(2, "주요 적응증 및 제품명"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_dict_of_list_or_text(self, number: int, title: str, data: Dict[str, Any]) -> Iterator[Flowable]:
+        """항목별 원형 번호 목록 또는 본문 섹션 (주요 적응증 및 제품명)"""
+        yield from self._emit_header(number, title)
         
         sub_num = 1
         for key, value in data.items():
-            if value and value != "정보 없음":
-                story.append(self.create_subsection_with_number(2, sub_num, key))
+            if _is_valid(value):
+                yield self.create_subsection_with_number(number, sub_num, key)
                 
                 if isinstance(value, list):
-                    for i, item in enumerate(value, 1):
-                        if item and item != "정보 없음":
-                            story.append(self.create_circled_list_item(i, item))
+                    yield from (
+                        self.create_circled_list_item(i, item)
+                        for i, item in enumerate(filter(_is_valid, value), 1)
+                    )
                 else:
-                    story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{value}</para>', self.styles['Normal']))
+                    yield Paragraph(str(value), self._body_style)
                 sub_num += 1
-        
-        return story
     
-    def _process_composition_section(self, data: List[Dict], section_name: str) -> List:
-        """성분 및 함량 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(3, "성분 및 함량"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_composition(self, number: int, title: str, data: List[Dict]) -> Iterator[Flowable]:
+        """성분 및 함량 섹션"""
+        yield from self._emit_header(number, title)
         
         for i, component in enumerate(data, 1):
             if component and isinstance(component, dict):
@@ -270,173 +382,84 @@ class MedicalPDFExporter:
                 specification = component.get('규격', '')
                 standard = component.get('기준', '')
                 
-                if component_name and component_name != "정보 없음":
-                    story.append(self.create_subsection_with_number(3, i, component_name))
+                if _is_valid(component_name):
+                    yield self.create_subsection_with_number(number, i, component_name)
                     
-                    if specification and specification != "정보 없음":
-                        story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="20">규격: {specification}</para>', self.styles['Normal']))
+                    if _is_valid(specification):
+                        yield Paragraph(f"규격: {specification}", self._detail_style)
                     
-                    if standard and standard != "정보 없음":
-                        story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="20">기준: {standard}</para>', self.styles['Normal']))
-        
-        return story
-    
-    def _process_appearance_section(self, data: str, section_name: str) -> List:
-        """성상 섹션 처리"""
-        story = []
-        if data and data != "정보 없음":
-            story.append(Spacer(1, 20))
-            story.append(self.create_section_with_number(4, "성상"))
-            story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-            story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{data}</para>', self.styles['Normal']))
-        
-        return story
+                    if _is_valid(standard):
+                        yield Paragraph(f"기준: {standard}", self._detail_style)
     
-    def _process_effect_section(self, data: List[str], section_name: str) -> List:
-        """효능 및 효과 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(5, "효능 및 효과"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-        
-        for i, effect in enumerate(data, 1):
-            if effect and effect != "정보 없음":
-                story.append(self.create_list_item(i, effect))
-        
-        return story
-    
-    def _process_usage_section(self, data: List[Dict], section_name: str) -> List:
-        """용법 및 용량 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(6, "용법 및 용량"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_usage(self, number: int, title: str, data: List[Dict]) -> Iterator[Flowable]:
+        """용법 및 용량 섹션"""
+        yield from self._emit_header(number, title)
         
         for i, usage in enumerate(data, 1):
             if usage and isinstance(usage, dict):
                 indication = usage.get('적응증', '')
                 dosage = usage.get('용량', '')
                 
-                if indication and indication != "정보 없음":
-                    story.append(self.create_subsection_with_number(6, i, f"적응증: {indication}"))
+                if _is_valid(indication):
+                    yield self.create_subsection_with_number(number, i, f"적응증: {indication}")
                 
-                if dosage and dosage != "정보 없음":
-                    story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="30">용량: {dosage}</para>', self.styles['Normal']))
-        
-        return story
+                if _is_valid(dosage):
+                    yield Paragraph(f"용량: {dosage}", self._list_style)
     
-    def _process_precaution_section(self, data: Dict[str, List], section_name: str) -> List:
-        """사용상 주의사항 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(7, "사용상 주의사항"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_precaution(self, number: int, title: str, data: Dict[str, List]) -> Iterator[Flowable]:
+        """사용상 주의사항 섹션 (분류별 글머리 목록)"""
+        yield from self._emit_header(number, title)
         
         sub_num = 1
         for category, items in data.items():
             if items and isinstance(items, list):
-                valid_items = [item for item in items if item and item != "정보 없음"]
+                valid_items = [item for item in items if _is_valid(item)]
                 if valid_items:
-                    story.append(self.create_subsection_with_number(7, sub_num, category))
-                    for item in valid_items:
-                        story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="30">• {item}</para>', self.styles['Normal']))
+                    yield self.create_subsection_with_number(number, sub_num, category)
+                    yield from (Paragraph(f"• {item}", self._list_style) for item in valid_items)
                     sub_num += 1
-        
-        return story
     
-    def _process_interaction_section(self, data: List[str], section_name: str) -> List:
-        """상호작용 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(8, "상호작용"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-        
-        for i, interaction in enumerate(data, 1):
-            if interaction and interaction != "정보 없음":
-                story.append(self.create_list_item(i, interaction))
-        
-        return story
-    
-    def _process_pregnancy_section(self, data: Dict[str, str], section_name: str) -> List:
-        """임부 및 수유부 사용 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(9, "임부 및 수유부 사용"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+    def _emit_storage(self, number: int, title: str, data: Dict[str, Any]) -> Iterator[Flowable]:
+        """보관 및 취급 섹션 (주의사항은 글머리 목록, 나머지는 본문)"""
+        yield from self._emit_header(number, title)
         
         sub_num = 1
         for key, value in data.items():
-            if value and value != "정보 없음":
-                story.append(self.create_subsection_with_number(9, sub_num, key))
-                story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{value}</para>', self.styles['Normal']))
-                sub_num += 1
-        
-        return story
-    
-    def _process_elderly_section(self, data: str, section_name: str) -> List:
-        """고령자 사용 섹션 처리"""
-        story = []
-        if data and data != "정보 없음":
-            story.append(Spacer(1, 20))
-            story.append(self.create_section_with_number(10, "고령자 사용"))
-            story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-            story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{data}</para>', self.styles['Normal']))
-        
-        return story
-    
-    def _process_caution_section(self, data: List[str], section_name: str) -> List:
-        """적용 시 주의사항 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(11, "적용 시 주의사항"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-        
-        for i, caution in enumerate(data, 1):
-            if caution and caution != "정보 없음":
-                story.append(self.create_list_item(i, caution))
-        
-        return story
-    
-    def _process_storage_section(self, data: Dict[str, Any], section_name: str) -> List:
-        """보관 및 취급 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(12, "보관 및 취급"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-        
-        sub_num = 1
-        for key, value in data.items():
-            if value and value != "정보 없음":
+            if _is_valid(value):
                 if key == '주의사항' and isinstance(value, list):
-                    story.append(self.create_subsection_with_number(12, sub_num, key))
-                    for item in value:
-                        if item and item != "정보 없음":
-                            story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="4" spaceBefore="4" leftIndent="30">• {item}</para>', self.styles['Normal']))
+                    yield self.create_subsection_with_number(number, sub_num, key)
+                    yield from (
+                        Paragraph(f"• {item}", self._list_style)
+                        for item in value if _is_valid(item)
+                    )
                     sub_num += 1
                 elif key != '주의사항':
-                    story.append(self.create_subsection_with_number(12, sub_num, key))
-                    story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{value}</para>', self.styles['Normal']))
+                    yield self.create_subsection_with_number(number, sub_num, key)
+                    yield Paragraph(str(value), self._body_style)
                     sub_num += 1
-        
-        return story
-    
-    def _process_company_section(self, data: Dict[str, str], section_name: str) -> List:
-        """제조 및 판매사 정보 섹션 처리"""
-        story = []
-        story.append(Spacer(1, 20))
-        story.append(self.create_section_with_number(13, "제조 및 판매사 정보"))
-        story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
-        
-        sub_num = 1
-        for key, value in data.items():
-            if value and value != "정보 없음":
-                story.append(self.create_subsection_with_number(13, sub_num, key))
-                story.append(Paragraph(f'<para fontSize="11" fontName="{self.korean_font}" spaceAfter="6" spaceBefore="6" leftIndent="20" alignment="justify">{value}</para>', self.styles['Normal']))
-                sub_num += 1
-        
-        return story
+
+@functools.lru_cache(maxsize=1)
+def _get_exporter() -> MedicalPDFExporter:
+    """스타일과 폰트 설정을 재사용하도록 공유 생성기를 반환합니다."""
+    return MedicalPDFExporter()
 
 def export_overview_to_pdf(data: Dict[str, Any], output_path: str) -> str:
     """의약품 개요서를 PDF로 내보내기 (편의 함수)"""
-    exporter = MedicalPDFExporter()
-    return exporter.export_overview_to_pdf(data, output_path) 
\ No newline at end of file
+    return _get_exporter().export_overview_to_pdf(data, output_path) 
+
+def export_many(jobs: List[Tuple[Dict[str, Any], str]], workers: Optional[int] = None) -> List[str]:
+    """여러 개요서를 프로세스 풀에서 병렬로 PDF로 내보내기
+
+    doc.build는 GIL을 잡는 CPU 작업이므로 스레드 대신 프로세스를 사용하고,
+    각 워커는 시작할 때 폰트 등록과 스타일 설정을 미리 해 둡니다.
+    결과는 jobs 순서대로 생성된 경로(실패 시 "")를 반환합니다.
+    """
+    if not jobs:
+        return []
+    if len(jobs) == 1 or workers == 1:
+        return [export_overview_to_pdf(data, output_path) for data, output_path in jobs]
+    
+    datas = [data for data, _ in jobs]
+    output_paths = [output_path for _, output_path in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_get_exporter) as executor:
+        return list(executor.map(export_overview_to_pdf, datas, output_paths))
\ No newline at end of file
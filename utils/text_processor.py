@@ -1,61 +1,83 @@
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple, Optional
 from llm.ollama_client import generate_overview_with_llm, test_ollama_connection
 import re
 import json
+import copy
+import functools
+import hashlib
+import heapq
+import inspect
+import logging
+import os
+import orjson
+import threading
+from rapidfuzz import fuzz, process
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import unicodedata
+from utils.llm_cache import llm_cache
+
+logger = logging.getLogger(__name__)
+
+_DIGIT_RE = re.compile(r'\d')
+_KOREAN_CHAR_RE = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+
+# 제거 대상: 한자, 히라가나, 가타카나, 태국어, 아랍어, 그리스어, 러시아어 | 허용 목록 밖의 특수기호
+_FOREIGN_STRIP_RE = re.compile(
+    r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\u0e00-\u0e7f\u0600-\u06ff\u0370-\u03ff\u0400-\u04ff]'
+    r'|[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ\-\.\,\:\;\(\)\[\]\{\}\+\-\=\*\/\@\#\$\%\&\?\!]'
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+# 응답 텍스트 안의 JSON 객체 (첫 '{'부터 마지막 '}'까지)
+_JSON_RE = re.compile(r'\{.*\}', re.S)
+_JSON_DECODER = json.JSONDecoder()
 
 def clean_foreign_languages(text: str) -> str:
     """외국어, 한자, 특수기호를 제거하고 한국어만 남깁니다."""
     if not text:
         return ""
     
-    # 한자 제거 (CJK Unified Ideographs)
-    text = re.sub(r'[\u4e00-\u9fff]', '', text)
-    
-    # 일본어 히라가나 제거
-    text = re.sub(r'[\u3040-\u309f]', '', text)
-    
-    # 일본어 가타카나 제거
-    text = re.sub(r'[\u30a0-\u30ff]', '', text)
-    
-    # 태국어 제거
-    text = re.sub(r'[\u0e00-\u0e7f]', '', text)
-    
-    # 아랍어 제거
-    text = re.sub(r'[\u0600-\u06ff]', '', text)
-    
-    # 그리스어 제거
-    text = re.sub(r'[\u0370-\u03ff]', '', text)
-    
-    # 러시아어 제거
-    text = re.sub(r'[\u0400-\u04ff]', '', text)
-    
-    # 특수기호 제거 (의약품 관련 기호는 제외)
-    text = re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ\-\.\,\:\;\(\)\[\]\{\}\+\-\=\*\/\@\#\$\%\&\?\!]', '', text)
-    
-    # 연속된 공백 제거
-    text = re.sub(r'\s+', ' ', text)
-    
-    # 앞뒤 공백 제거
-    text = text.strip()
-    
-    return text
+    # 외국 문자와 특수기호(의약품 관련 기호 제외)를 한 번에 제거한 뒤 연속된 공백 정리
+    return _WHITESPACE_RE.sub(' ', _FOREIGN_STRIP_RE.sub('', text)).strip()
 
 def is_korean_text(text: str) -> bool:
     """텍스트가 한국어인지 확인합니다."""
     if not text:
         return False
     
-    # 한글 문자 비율 계산
-    korean_chars = len(re.findall(r'[가-힣ㄱ-ㅎㅏ-ㅣ]', text))
-    total_chars = len(text.replace(' ', ''))
+    # 한글 문자 비율 계산 (일치 목록이나 공백 제거 사본을 만들지 않고 개수만 셈)
+    korean_chars = sum(1 for _ in _KOREAN_CHAR_RE.finditer(text))
+    total_chars = len(text) - text.count(' ')
     
     if total_chars == 0:
         return False
     
     return korean_chars / total_chars > 0.3  # 30% 이상이 한글이면 한국어로 간주
 
+# 토큰화 시 하나의 토큰으로 보호할 의약품 관련 특수 패턴 (앞에 있는 패턴이 우선)
+_PROTECTED_TOKEN_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\d+\.?\d*\s*(?:mg|g|ml|mcg|IU|단위|정|캡슐|주사제)',
+    r'\d+%',
+    r'USP|EP|JP',
+    r'필름코팅정',
+    r'아세트아미노펜|이부프로펜|아스피린|세마글루타이드|메트포르민|글리메피리드|파세타민',
+)), re.IGNORECASE)
+
+# 일반 토큰: 구분자(공백, 구두점)가 아닌 문자가 이어진 구간
+_PLAIN_TOKEN_RE = re.compile(r'[^\s\.,;:!?()\[\]{}"\']+')
+
+def iter_tokens(text: str) -> Iterator[str]:
+    """텍스트의 토큰을 앞에서부터 하나씩 돌려줍니다 (중간 리스트 없이 split_into_tokens와 같은 순서)."""
+    # 보호 패턴 구간은 그대로 하나의 토큰으로 두고, 그 사이 구간에서만 일반 토큰을 찾음
+    position = 0
+    for match in _PROTECTED_TOKEN_RE.finditer(text):
+        for token in _PLAIN_TOKEN_RE.finditer(text, position, match.start()):
+            yield token.group()
+        yield match.group()
+        position = match.end()
+    for token in _PLAIN_TOKEN_RE.finditer(text, position):
+        yield token.group()
+
 def split_into_tokens(text: str) -> List[str]:
     """텍스트를 토큰(단어/글자) 단위로 분할합니다."""
     # 한글, 영문, 숫자, 특수문자를 모두 포함하여 토큰화
@@ -63,290 +85,315 @@ def split_into_tokens(text: str) -> List[str]:
     # 영문: 알파벳
     # 숫자: 0-9
     # 특수문자: 의약품 관련 특수문자 (mg, g, ml, %, 등)
-    
-    # 먼저 의약품 관련 특수 패턴을 보호
-    protected_patterns = [
-        r'\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위|정|캡슐|주사제)',
-        r'\d+%',
-        r'USP|EP|JP',
-        r'필름코팅정',
-        r'아세트아미노펜|이부프로펜|아스피린|세마글루타이드|메트포르민|글리메피리드|파세타민'
-    ]
-    
-    # 보호할 패턴들을 임시 마커로 교체
-    protected_tokens = []
-    token_to_marker = {}
-    
-    for i, pattern in enumerate(protected_patterns):
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            marker = f"__PROTECTED_{i}_{len(protected_tokens)}__"
-            token_to_marker[marker] = match.group()
-            protected_tokens.append(match.group())
-    
-    # 보호된 패턴들을 마커로 교체
-    for marker, token in token_to_marker.items():
-        text = text.replace(token, marker)
-    
-    # 일반적인 토큰화 (공백, 구두점 기준)
-    tokens = re.split(r'[\s\.,;:!?()\[\]{}"\']+', text)
-    
-    # 빈 토큰 제거 및 정리
-    cleaned_tokens = []
-    for token in tokens:
-        token = token.strip()
-        if token and len(token) >= 1:  # 1글자 이상인 토큰만 포함
-            cleaned_tokens.append(token)
-    
-    # 보호된 토큰들을 원래 값으로 복원
-    final_tokens = []
-    for token in cleaned_tokens:
-        if token.startswith("__PROTECTED_"):
-            # 마커에서 원래 토큰 복원
-            if token in token_to_marker:
-                final_tokens.append(token_to_marker[token])
-            else:
-                final_tokens.append(token)
-        else:
-            final_tokens.append(token)
-    
-    return final_tokens
-
-def extract_keywords_from_tokens(tokens: List[str]) -> List[str]:
+    return list(iter_tokens(text))
+
+# extract_keywords_from_tokens 판별용 단어 사전 (호출마다 목록을 만들지 않도록 모듈 수준에서 한 번 구성)
+# 단어 경계(\b) 패턴의 대안들: 토큰의 단어 구간 중 하나가 이 단어와 같으면(대소문자 무시) 일치
+_KEYWORD_PATTERN_WORDS = frozenset(word.casefold() for word in (
+    '정제', '주사제', '캡슐', '시럽', '연고', '크림', '액제', '분말', '과립', '정', '필름코팅정',
+    '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드', '메트포르민', '글리메피리드', '파세타민',
+    'USP', 'EP', 'JP', '순도', '함량', '성분', '주성분', '첨가제', '결합제', '희석제',
+    '용기', '포장', '병', '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터', '포일',
+    '용출', '붕해', '생체이용률', '안정성', '성능', '특성', '분해', '용해도',
+    '보존제', '멸균', '미생물', '무균', '살균', '방부제',
+    '개발', '연구', '제형개발', '처방개발', '선택근거', '개발근거',
+    '외형', '모양', '색상', '색깔', '흰색', '노란색', '각인', '표시', '마크',
+    '경구용', '주사용', '외용', '내용', '투여', '복용',
+))
+
+# 일반적인 의약품 관련 단어들 (소문자 토큰과 비교)
+_MEDICAL_WORDS = frozenset((
+    '제품명', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
+    '안정성', '보존제', '멸균', '개발', '연구', '특성', '성능', '외형',
+    '투여', '복용', '경구', '주사', '외용', '내용', '정제', '주사제',
+    '캡슐', '시럽', '연고', '크림', '액제', '분말', '과립', '정',
+    '필름코팅정', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드',
+    '메트포르민', '글리메피리드', '파세타민', 'USP', 'EP', 'JP', '순도',
+    '주성분', '첨가제', '결합제', '희석제', '병', '앰플', '바이알',
+    '플라스틱', '유리', '알루미늄', '블리스터', '포일', '생체이용률',
+    '분해', '용해도', '미생물', '무균', '살균', '방부제', '제형개발',
+    '처방개발', '선택근거', '개발근거', '색상', '색깔', '흰색', '노란색',
+    '각인', '표시', '마크', '원형', '타원형', '임상', '시험', '흡수',
+    '배설', '세균', '균'
+))
+
+# 의약품 관련 한글 단어들 (2글자 이상 토큰과 비교)
+_KOREAN_MEDICAL_WORDS = frozenset((
+    '제품', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
+    '안정', '보존', '멸균', '개발', '연구', '특성', '성능', '외형',
+    '투여', '복용', '경구', '주사', '외용', '내용', '정제', '주사',
+    '캡슐', '시럽', '연고', '크림', '액제', '분말', '과립', '정',
+    '필름', '코팅', '순도', '주성', '첨가', '결합', '희석', '병',
+    '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터',
+    '포일', '생체', '이용률', '분해', '용해', '미생물', '무균',
+    '살균', '방부', '제형', '처방', '선택', '근거', '색상', '색깔',
+    '흰색', '노란색', '각인', '표시', '마크', '원형', '타원형',
+    '임상', '시험', '흡수', '배설', '세균', '균', '아세트', '아미노',
+    '펜', '이부', '프로', '펜', '아스피', '린', '세마', '글루',
+    '타이드', '메트', '포르민', '글리', '메피', '리드', '파세',
+    '타민'
+))
+
+_WORD_RUN_RE = re.compile(r'\w+')
+
+def extract_keywords_from_tokens(tokens: Iterable[str]) -> List[str]:
     """토큰 리스트에서 의약품 관련 키워드를 추출합니다."""
     keywords = []
     
-    # 의약품 관련 키워드 패턴
-    medical_patterns = [
-        r'\b\d+\.?\d*\s*(mg|g|ml|mcg|IU|단위|정|캡슐|주사제)\b',
-        r'\b(정제|주사제|캡슐|시럽|연고|크림|액제|분말|과립|정|필름코팅정)\b',
-        r'\b(아세트아미노펜|이부프로펜|아스피린|세마글루타이드|메트포르민|글리메피리드|파세타민)\b',
-        r'\b(USP|EP|JP|순도|함량|성분|주성분|첨가제|결합제|희석제)\b',
-        r'\b(용기|포장|병|앰플|바이알|플라스틱|유리|알루미늄|블리스터|포일)\b',
-        r'\b(용출|붕해|생체이용률|안정성|성능|특성|분해|용해도)\b',
-        r'\b(보존제|멸균|미생물|무균|살균|방부제)\b',
-        r'\b(개발|연구|제형개발|처방개발|선택근거|개발근거)\b',
-        r'\b(외형|모양|색상|색깔|흰색|노란색|각인|표시|마크)\b',
-        r'\b(경구용|주사용|외용|내용|투여|복용)\b',
-    ]
+    # 각 토큰을 검사 (수치+단위 패턴은 숫자 포함 조건에 포함되므로 따로 검사하지 않음)
+    # 같은 토큰은 한 번만 검사하고, 처음 나온 순서를 유지
+    for token in dict.fromkeys(tokens):
+        if (
+            # 숫자가 포함된 토큰 (함량 정보)
+            _DIGIT_RE.search(token)
+            # 일반적인 의약품 관련 단어들
+            or token.lower() in _MEDICAL_WORDS
+            # 한글 의약품 관련 단어 (2글자 이상)
+            or (len(token) >= 2 and token in _KOREAN_MEDICAL_WORDS)
+            # 의약품 관련 키워드 패턴 (단어 구간 단위 일치)
+            or any(run.casefold() in _KEYWORD_PATTERN_WORDS for run in _WORD_RUN_RE.findall(token))
+        ):
+            keywords.append(token)
     
-    # 각 토큰을 검사
-    for token in tokens:
-        token_lower = token.lower()
-        
-        # 패턴 매칭
-        for pattern in medical_patterns:
-            if re.search(pattern, token, re.IGNORECASE):
-                keywords.append(token)
+    # 정리
+    return [kw.strip() for kw in keywords if len(kw.strip()) >= 1]
+
+# 각 항목별 대표 키워드 세트 정의 (한국 의약품 설명서 구조에 최적화)
+_SECTION_KEYWORD_SETS = {
+    "성분 및 함량": {
+        "keywords": ["성분", "주성분", "첨가제", "결합제", "희석제", "아세트아미노펜", "이부프로펜", "아스피린", "세마글루타이드", "메트포르민", "파세타민", "USP", "EP", "JP", "순도", "아세트", "아미노", "펜", "이부", "프로", "세마", "글루", "타이드", "메트", "포르민", "글리", "메피", "리드", "파세", "타민", "mg", "g", "ml", "mcg", "단위", "함량", "배합목적", "주성분", "첨가성분", "보조성분", "기준", "분량", "투여단위", "함량", "순도", "함유량", "포함량", "규격"],
+        "weight": 1.2
+    },
+    "성상": {
+        "keywords": ["외형", "모양", "색상", "색깔", "흰색", "노란색", "각인", "표시", "마크", "원형", "타원형", "정사각형", "직사각형", "무색", "투명", "불투명", "외관", "형태", "크기", "무게", "두께", "지름", "길이", "폭", "성상"],
+        "weight": 1.0
+    },
+    "효능 및 효과": {
+        "keywords": ["효능", "효과", "작용", "약리작용", "치료효과", "치료작용", "약효", "효과성", "치료", "개선", "완화", "해열", "진통", "소염", "항염증", "항생", "항균", "항바이러스", "항암", "항고혈압", "항당뇨", "항혈전"],
+        "weight": 1.1
+    },
+    "용법 및 용량": {
+        "keywords": ["용법", "용량", "투여", "복용", "투여량", "복용량", "투여방법", "복용방법", "투여간격", "복용간격", "투여기간", "복용기간", "적응증", "투여경로", "복용경로", "경구", "주사", "점적", "도포", "흡입"],
+        "weight": 1.1
+    },
+    "사용상 주의사항": {
+        "keywords": ["주의사항", "경고", "금기", "주의", "이상반응", "부작용", "부정반응", "알레르기", "과민반응", "중독", "중독성", "의존성", "습관성", "내성", "내약성", "내성발생", "내약성발생", "주의환자", "주의필요", "주의대상"],
+        "weight": 1.0
+    },
+    "상호작용": {
+        "keywords": ["상호작용", "약물상호작용", "약물간상호작용", "약물조합", "약물병용", "약물배합", "약물결합", "약물반응", "약물효과", "약물영향", "약물작용", "약물반응성", "약물민감성"],
+        "weight": 0.9
+    },
+    "임부 및 수유부 사용": {
+        "keywords": ["임부", "임신부", "임신", "수유부", "수유", "태아", "태아기", "태아발달", "태아영향", "태아독성", "태아기형", "태아기형성", "태아발달장애", "태아발달지연", "태아발달영향"],
+        "weight": 0.9
+    },
+    "고령자 사용": {
+        "keywords": ["고령자", "노인", "노년", "고령", "노화", "노인성", "노년성", "고령자용", "노인용", "노년용", "고령자적합", "노인적합", "노년적합"],
+        "weight": 0.8
+    },
+    "적용 시 주의사항": {
+        "keywords": ["적용", "적용시", "적용시주의", "적용주의", "적용시주의사항", "적용주의사항", "적용시주의점", "적용주의점", "적용시주의할점", "적용주의할점"],
+        "weight": 0.8
+    },
+    "보관 및 취급": {
+        "keywords": ["보관", "보관조건", "보관방법", "보관온도", "보관습도", "보관장소", "보관기간", "보관주의", "보관주의사항", "보관주의점", "보관주의할점", "취급", "취급방법", "취급주의", "취급주의사항", "취급주의점", "취급주의할점", "포장", "포장단위", "포장방법", "포장주의", "포장주의사항"],
+        "weight": 1.0
+    },
+    "제조 및 판매사 정보": {
+        "keywords": ["제조사", "제조업체", "제조회사", "제조기업", "제조공장", "제조시설", "제조설비", "제조라인", "제조공정", "제조과정", "제조방법", "제조기술", "제조품질", "제조관리", "판매사", "판매업체", "판매회사", "판매기업", "판매점", "판매소", "판매처", "판매망", "판매네트워크", "공장", "공장주소", "공장위치", "공장소재지", "공장소재", "소비자상담실", "고객상담실", "상담실", "상담소", "상담센터"],
+        "weight": 0.7
+    }
+}
+
+# 분류 시 매번 소문자 변환/분할하지 않도록 항목별 (항목, 가중치, 소문자 키워드, 키워드 토큰)을 미리 계산
+_SECTION_KEYWORD_LOOKUP = tuple(
+    (
+        section,
+        config["weight"],
+        tuple(section_keyword.lower() for section_keyword in config["keywords"]),
+        tuple(tuple(section_keyword.lower().split()) for section_keyword in config["keywords"]),
+    )
+    for section, config in _SECTION_KEYWORD_SETS.items()
+)
+
+# 점수 계산은 항목 번호(위 순서)로 색인한 리스트에서 수행
+_SECTION_NAMES = tuple(section for section, _, _, _ in _SECTION_KEYWORD_LOOKUP)
+_SECTION_WEIGHTS = tuple(weight for _, weight, _, _ in _SECTION_KEYWORD_LOOKUP)
+
+def _freeze_counts(index: Dict[str, Dict[int, int]]) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """{단어: {항목 번호: 수}}를 {단어: ((항목 번호, 수), ...)}로 바꿉니다."""
+    return {term: tuple(counts.items()) for term, counts in index.items()}
+
+def _build_section_substring_index() -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """부분 문자열 → ((항목 번호, 그 부분 문자열을 포함하는 항목 키워드 수), ...) 역색인을 만듭니다."""
+    index: Dict[str, Dict[int, int]] = {}
+    for section_index, (_, _, section_keywords_lower, _) in enumerate(_SECTION_KEYWORD_LOOKUP):
+        for section_keyword in section_keywords_lower:
+            substrings = {
+                section_keyword[start:end]
+                for start in range(len(section_keyword) + 1)
+                for end in range(start, len(section_keyword) + 1)
+            }
+            for substring in substrings:
+                counts = index.setdefault(substring, {})
+                counts[section_index] = counts.get(section_index, 0) + 1
+    return _freeze_counts(index)
+
+# "키워드가 항목 키워드에 포함" 판정을 사전 조회로 대신함
+_SECTION_SUBSTRING_INDEX = _build_section_substring_index()
+
+# 트라이 노드에서 단어 끝을 표시하는 키 (문자 키와 겹치지 않는 빈 문자열)
+_TRIE_END = ''
+
+def _build_section_trie() -> Tuple[Dict[str, Any], Dict[str, Tuple[Tuple[int, int], ...]], Dict[str, frozenset]]:
+    """항목 키워드와 그 토큰으로 트라이를 만듭니다.
+
+    함께 반환하는 사전:
+    - 항목 키워드 → ((항목 번호, 같은 항목 키워드 수), ...) (직접 매칭 점수)
+    - 토큰 → 그 토큰을 가진 (항목 번호, 항목 키워드 위치) 집합 (부분 매칭 점수)
+    """
+    trie: Dict[str, Any] = {}
+    keyword_owners: Dict[str, Dict[int, int]] = {}
+    token_owners: Dict[str, set] = {}
+    for section_index, (_, _, section_keywords_lower, section_keyword_tokens) in enumerate(_SECTION_KEYWORD_LOOKUP):
+        for position, (section_keyword, tokens) in enumerate(zip(section_keywords_lower, section_keyword_tokens)):
+            counts = keyword_owners.setdefault(section_keyword, {})
+            counts[section_index] = counts.get(section_index, 0) + 1
+            for token in tokens:
+                token_owners.setdefault(token, set()).add((section_index, position))
+    for term in keyword_owners.keys() | token_owners.keys():
+        if not term:
+            continue
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = term
+    return trie, _freeze_counts(keyword_owners), {token: frozenset(owners) for token, owners in token_owners.items()}
+
+# "항목 키워드(또는 그 토큰)가 키워드에 포함" 판정을 트라이 탐색으로 대신함
+_SECTION_TRIE, _SECTION_KEYWORD_OWNERS, _SECTION_TOKEN_OWNERS = _build_section_trie()
+
+def _find_section_terms(text: str) -> set:
+    """text에 부분 문자열로 들어 있는 항목 키워드/토큰을 모두 찾습니다 (시작 위치마다 트라이를 따라감)."""
+    found = set()
+    for start in range(len(text)):
+        node = _SECTION_TRIE
+        for index in range(start, len(text)):
+            node = node.get(text[index])
+            if node is None:
                 break
+            term = node.get(_TRIE_END)
+            if term is not None:
+                found.add(term)
+    return found
+
+def _classify_keyword(keyword: str, keyword_lower: str) -> str:
+    """키워드 하나를 가장 점수가 높은 항목에 분류합니다 (가중치 기반, keyword_lower는 소문자로 변환된 키워드)."""
+    best_section = None
+    best_score = 0.0
+    
+    # 직접 매칭 수: 키워드를 포함하는 항목 키워드 + 키워드에 포함된 (그 외) 항목 키워드
+    direct_counts = [0] * len(_SECTION_NAMES)
+    for section_index, count in _SECTION_SUBSTRING_INDEX.get(keyword_lower, ()):
+        direct_counts[section_index] += count
+    # 부분 매칭 수: 토큰 중 하나라도 키워드에 포함된 항목 키워드
+    partial_owners = set()
+    for term in _find_section_terms(keyword_lower):
+        if term != keyword_lower:
+            for section_index, count in _SECTION_KEYWORD_OWNERS.get(term, ()):
+                direct_counts[section_index] += count
+        partial_owners.update(_SECTION_TOKEN_OWNERS.get(term, ()))
+    partial_counts = [0] * len(_SECTION_NAMES)
+    for section_index, _ in partial_owners:
+        partial_counts[section_index] += 1
+    
+    # 각 항목별로 유사도 점수 계산
+    for section, weight, direct_count, partial_count in zip(_SECTION_NAMES, _SECTION_WEIGHTS, direct_counts, partial_counts):
+        direct_match_score = float(direct_count)
+        partial_match_score = 0.5 * partial_count
         
-        # 일반적인 의약품 관련 단어들
-        medical_words = [
-            '제품명', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
-            '안정성', '보존제', '멸균', '개발', '연구', '특성', '성능', '외형',
-            '투여', '복용', '경구', '주사', '외용', '내용', '정제', '주사제',
-            '캡슐', '시럽', '연고', '크림', '액제', '분말', '과립', '정',
-            '필름코팅정', '아세트아미노펜', '이부프로펜', '아스피린', '세마글루타이드',
-            '메트포르민', '글리메피리드', '파세타민', 'USP', 'EP', 'JP', '순도',
-            '주성분', '첨가제', '결합제', '희석제', '병', '앰플', '바이알',
-            '플라스틱', '유리', '알루미늄', '블리스터', '포일', '생체이용률',
-            '분해', '용해도', '미생물', '무균', '살균', '방부제', '제형개발',
-            '처방개발', '선택근거', '개발근거', '색상', '색깔', '흰색', '노란색',
-            '각인', '표시', '마크', '원형', '타원형', '임상', '시험', '흡수',
-            '배설', '세균', '균'
-        ]
-        
-        if token_lower in medical_words:
-            keywords.append(token)
-        
-        # 숫자가 포함된 토큰 (함량 정보)
-        if re.search(r'\d', token):
-            keywords.append(token)
+        # 최종 점수 계산
+        total_score = (direct_match_score + partial_match_score) * weight
         
-        # 한글 의약품 관련 단어 (2글자 이상)
-        if len(token) >= 2 and re.search(r'[가-힣]', token):
-            # 의약품 관련 한글 단어들
-            korean_medical_words = [
-                '제품', '제형', '함량', '성분', '용기', '포장', '용출', '붕해',
-                '안정', '보존', '멸균', '개발', '연구', '특성', '성능', '외형',
-                '투여', '복용', '경구', '주사', '외용', '내용', '정제', '주사',
-                '캡슐', '시럽', '연고', '크림', '액제', '분말', '과립', '정',
-                '필름', '코팅', '순도', '주성', '첨가', '결합', '희석', '병',
-                '앰플', '바이알', '플라스틱', '유리', '알루미늄', '블리스터',
-                '포일', '생체', '이용률', '분해', '용해', '미생물', '무균',
-                '살균', '방부', '제형', '처방', '선택', '근거', '색상', '색깔',
-                '흰색', '노란색', '각인', '표시', '마크', '원형', '타원형',
-                '임상', '시험', '흡수', '배설', '세균', '균', '아세트', '아미노',
-                '펜', '이부', '프로', '펜', '아스피', '린', '세마', '글루',
-                '타이드', '메트', '포르민', '글리', '메피', '리드', '파세',
-                '타민'
-            ]
-            
-            if token in korean_medical_words:
-                keywords.append(token)
+        if total_score > best_score:
+            best_score = total_score
+            best_section = section
+    
+    # 최고 점수 항목에 키워드 배정 (점수가 0.5 이상인 경우만)
+    if best_section and best_score >= 0.5:
+        return best_section
     
-    # 중복 제거 및 정리
-    unique_keywords = list(set(keywords))
-    return [kw.strip() for kw in unique_keywords if len(kw.strip()) >= 1]
+    # 점수가 낮은 경우 기본 분류 규칙 적용
+    if _DIGIT_RE.search(keyword):
+        return "성분 및 함량"
+    elif any(word in keyword_lower for word in ['정', '캡슐', '주사제', '제형']):
+        return "성상"
+    elif any(word in keyword_lower for word in ['색상', '모양', '각인']):
+        return "성상"
+    elif any(word in keyword_lower for word in ['용기', '포장']):
+        return "보관 및 취급"
+    # 기본값으로 성분 및 함량에 배정
+    return "성분 및 함량"
 
 def classify_keywords_by_section(keywords: List[str]) -> Dict[str, List[str]]:
     """추출된 키워드를 7개 항목 중 하나에 분류합니다 (가중치 기반)."""
+    section_keywords = {section: [] for section in _SECTION_KEYWORD_SETS}
+    for keyword in keywords:
+        section_keywords[_classify_keyword(keyword, keyword.lower())].append(keyword)
+    return section_keywords
+
+@functools.lru_cache(maxsize=4096)
+def _context_score(keyword: str) -> float:
+    """문자 종류(숫자, 특수문자, 한글, 영문) 기반 문맥적 관련성 점수를 계산합니다."""
+    if len(keyword) < 1:  # 1글자 이상인 토큰도 포함
+        return 0.0
     
-    # 각 항목별 대표 키워드 세트 정의 (한국 의약품 설명서 구조에 최적화)
-    section_keyword_sets = {
-        "성분 및 함량": {
-            "keywords": ["성분", "주성분", "첨가제", "결합제", "희석제", "아세트아미노펜", "이부프로펜", "아스피린", "세마글루타이드", "메트포르민", "파세타민", "USP", "EP", "JP", "순도", "아세트", "아미노", "펜", "이부", "프로", "세마", "글루", "타이드", "메트", "포르민", "글리", "메피", "리드", "파세", "타민", "mg", "g", "ml", "mcg", "단위", "함량", "배합목적", "주성분", "첨가성분", "보조성분", "기준", "분량", "투여단위", "함량", "순도", "함유량", "포함량", "규격"],
-            "weight": 1.2
-        },
-        "성상": {
-            "keywords": ["외형", "모양", "색상", "색깔", "흰색", "노란색", "각인", "표시", "마크", "원형", "타원형", "정사각형", "직사각형", "무색", "투명", "불투명", "외관", "형태", "크기", "무게", "두께", "지름", "길이", "폭", "성상"],
-            "weight": 1.0
-        },
-        "효능 및 효과": {
-            "keywords": ["효능", "효과", "작용", "약리작용", "치료효과", "치료작용", "약효", "효과성", "치료", "개선", "완화", "해열", "진통", "소염", "항염증", "항생", "항균", "항바이러스", "항암", "항고혈압", "항당뇨", "항혈전"],
-            "weight": 1.1
-        },
-        "용법 및 용량": {
-            "keywords": ["용법", "용량", "투여", "복용", "투여량", "복용량", "투여방법", "복용방법", "투여간격", "복용간격", "투여기간", "복용기간", "적응증", "투여경로", "복용경로", "경구", "주사", "점적", "도포", "흡입"],
-            "weight": 1.1
-        },
-        "사용상 주의사항": {
-            "keywords": ["주의사항", "경고", "금기", "주의", "이상반응", "부작용", "부정반응", "알레르기", "과민반응", "중독", "중독성", "의존성", "습관성", "내성", "내약성", "내성발생", "내약성발생", "주의환자", "주의필요", "주의대상"],
-            "weight": 1.0
-        },
-        "상호작용": {
-            "keywords": ["상호작용", "약물상호작용", "약물간상호작용", "약물조합", "약물병용", "약물배합", "약물결합", "약물반응", "약물효과", "약물영향", "약물작용", "약물반응성", "약물민감성"],
-            "weight": 0.9
-        },
-        "임부 및 수유부 사용": {
-            "keywords": ["임부", "임신부", "임신", "수유부", "수유", "태아", "태아기", "태아발달", "태아영향", "태아독성", "태아기형", "태아기형성", "태아발달장애", "태아발달지연", "태아발달영향"],
-            "weight": 0.9
-        },
-        "고령자 사용": {
-            "keywords": ["고령자", "노인", "노년", "고령", "노화", "노인성", "노년성", "고령자용", "노인용", "노년용", "고령자적합", "노인적합", "노년적합"],
-            "weight": 0.8
-        },
-        "적용 시 주의사항": {
-            "keywords": ["적용", "적용시", "적용시주의", "적용주의", "적용시주의사항", "적용주의사항", "적용시주의점", "적용주의점", "적용시주의할점", "적용주의할점"],
-            "weight": 0.8
-        },
-        "보관 및 취급": {
-            "keywords": ["보관", "보관조건", "보관방법", "보관온도", "보관습도", "보관장소", "보관기간", "보관주의", "보관주의사항", "보관주의점", "보관주의할점", "취급", "취급방법", "취급주의", "취급주의사항", "취급주의점", "취급주의할점", "포장", "포장단위", "포장방법", "포장주의", "포장주의사항"],
-            "weight": 1.0
-        },
-        "제조 및 판매사 정보": {
-            "keywords": ["제조사", "제조업체", "제조회사", "제조기업", "제조공장", "제조시설", "제조설비", "제조라인", "제조공정", "제조과정", "제조방법", "제조기술", "제조품질", "제조관리", "판매사", "판매업체", "판매회사", "판매기업", "판매점", "판매소", "판매처", "판매망", "판매네트워크", "공장", "공장주소", "공장위치", "공장소재지", "공장소재", "소비자상담실", "고객상담실", "상담실", "상담소", "상담센터"],
-            "weight": 0.7
-        }
-    }
+    # 네 가지 문자 종류를 한 번의 순회로 확인 (\d, [^\w\s], [가-힣], [a-zA-Z]와 같은 판정)
+    has_number = has_special = has_korean = has_english = False
+    for char in keyword:
+        if char.isdecimal():
+            has_number = True
+        elif 'a' <= char <= 'z' or 'A' <= char <= 'Z':
+            has_english = True
+        elif '가' <= char <= '힣':
+            has_korean = True
+        elif not (char.isalnum() or char == '_' or char.isspace()):
+            has_special = True
+        else:
+            continue
+        if has_number and has_special and has_korean and has_english:
+            break
     
-    section_keywords = {
-        "성분 및 함량": [],
-        "성상": [],
-        "효능 및 효과": [],
-        "용법 및 용량": [],
-        "사용상 주의사항": [],
-        "상호작용": [],
-        "임부 및 수유부 사용": [],
-        "고령자 사용": [],
-        "적용 시 주의사항": [],
-        "보관 및 취급": [],
-        "제조 및 판매사 정보": []
-    }
+    # 한글이나 영문이 포함된 토큰에 더 높은 점수
+    return (0.3 + 0.2 * has_number + 0.2 * has_special + 0.2 * has_korean + 0.1 * has_english) * 0.2
+
+@functools.lru_cache(maxsize=4096)
+def _product_similarity(keyword_lower: str, product_tokens_lower: Tuple[str, ...]) -> float:
+    """키워드와 가장 비슷한 제품명 토큰의 유사도(0~1)를 계산합니다 (같은 키워드는 항목이 달라도 재사용)."""
+    best_match = process.extractOne(keyword_lower, product_tokens_lower, scorer=fuzz.ratio)
+    return best_match[1] / 100.0 if best_match else 0.0
+
+def _keyword_weight(keyword: str, keyword_lower: str, product_tokens_lower: Tuple[str, ...], frequency: int) -> float:
+    """키워드 하나의 가중치를 계산합니다 (keyword_lower, product_tokens_lower는 소문자로 변환된 키워드와 제품명 토큰)."""
+    # 1. 출현 빈도 점수 (40%)
+    frequency_score = min(frequency * 0.4, 0.4)
     
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        best_section = None
-        best_score = 0.0
-        
-        # 각 항목별로 유사도 점수 계산
-        for section, config in section_keyword_sets.items():
-            section_keywords_list = config["keywords"]
-            weight = config["weight"]
-            
-            # Jaccard 유사도 계산
-            keyword_tokens = set(keyword_lower.split())
-            section_tokens = set()
-            
-            for section_keyword in section_keywords_list:
-                section_tokens.update(section_keyword.lower().split())
-            
-            # 직접 매칭 점수
-            direct_match_score = 0.0
-            for section_keyword in section_keywords_list:
-                if section_keyword.lower() in keyword_lower or keyword_lower in section_keyword.lower():
-                    direct_match_score += 1.0
-            
-            # 부분 매칭 점수
-            partial_match_score = 0.0
-            for section_keyword in section_keywords_list:
-                if any(token in keyword_lower for token in section_keyword.lower().split()):
-                    partial_match_score += 0.5
-            
-            # 숫자가 포함된 키워드는 성분 정보에 높은 점수
-            number_bonus = 0.0
-            if re.search(r'\d+', keyword) and section == "성분 정보":
-                number_bonus = 0.3
-            
-            # 최종 점수 계산
-            total_score = (direct_match_score + partial_match_score + number_bonus) * weight
-            
-            if total_score > best_score:
-                best_score = total_score
-                best_section = section
-        
-        # 최고 점수 항목에 키워드 배정 (점수가 0.5 이상인 경우만)
-        if best_section and best_score >= 0.5:
-            section_keywords[best_section].append(keyword)
-        else:
-            # 점수가 낮은 경우 기본 분류 규칙 적용
-            if re.search(r'\d+', keyword):
-                section_keywords["성분 및 함량"].append(keyword)
-            elif any(word in keyword_lower for word in ['정', '캡슐', '주사제', '제형']):
-                section_keywords["성상"].append(keyword)
-            elif any(word in keyword_lower for word in ['색상', '모양', '각인']):
-                section_keywords["성상"].append(keyword)
-            elif any(word in keyword_lower for word in ['용기', '포장']):
-                section_keywords["보관 및 취급"].append(keyword)
-            else:
-                # 기본값으로 성분 및 함량에 배정
-                section_keywords["성분 및 함량"].append(keyword)
+    # 2. 제품명과의 유사도 점수 (40%)
+    similarity_score = _product_similarity(keyword_lower, product_tokens_lower) * 0.4
     
-    return section_keywords
+    # 3. 문맥적 관련성 점수 (20%)
+    context_score = _context_score(keyword)
+    
+    return frequency_score + similarity_score + context_score
 
 def calculate_keyword_weights(keywords: List[str], product_tokens: List[str], keyword_frequency: Dict[str, int]) -> List[Tuple[str, float]]:
     """키워드에 가중치를 계산합니다."""
-    from difflib import SequenceMatcher
-    
-    keyword_weights = []
-    
-    for keyword in keywords:
-        weight = 0.0
-        
-        # 1. 출현 빈도 점수 (40%)
-        frequency = keyword_frequency.get(keyword, 1)
-        frequency_score = min(frequency * 0.4, 0.4)
-        
-        # 2. 제품명과의 유사도 점수 (40%)
-        similarity_score = 0.0
-        for token in product_tokens:
-            similarity = SequenceMatcher(None, keyword.lower(), token.lower()).ratio()
-            similarity_score = max(similarity_score, similarity)
-        similarity_score *= 0.4
-        
-        # 3. 문맥적 관련성 점수 (20%)
-        context_score = 0.0
-        if len(keyword) >= 1:  # 1글자 이상인 토큰도 포함
-            has_number = bool(re.search(r'\d', keyword))
-            has_special = bool(re.search(r'[^\w\s]', keyword))
-            has_korean = bool(re.search(r'[가-힣]', keyword))
-            has_english = bool(re.search(r'[a-zA-Z]', keyword))
-            
-            # 한글이나 영문이 포함된 토큰에 더 높은 점수
-            context_score = (0.3 + 0.2 * has_number + 0.2 * has_special + 0.2 * has_korean + 0.1 * has_english) * 0.2
-        
-        weight = frequency_score + similarity_score + context_score
-        keyword_weights.append((keyword, weight))
+    product_tokens_lower = tuple(token.lower() for token in product_tokens)
+    keyword_weights = [
+        (keyword, _keyword_weight(keyword, keyword.lower(), product_tokens_lower, keyword_frequency.get(keyword, 1)))
+        for keyword in keywords
+    ]
     
     # 가중치 순으로 정렬
     keyword_weights.sort(key=lambda x: x[1], reverse=True)
@@ -366,13 +413,41 @@ def get_top_keywords_by_section(section_keywords: Dict[str, List[str]], product_
     
     return top_keywords
 
-def generate_section_sentences(product_name: str, section_keywords: Dict[str, List[str]]) -> Dict[str, str]:
-    """각 항목별로 LLM 프롬프트로 문장을 생성합니다."""
-    generated_sentences = {}
+def _collect_section_keywords(all_keywords: List[str], product_tokens: List[str], top_n: int = 3) -> Tuple[Counter, Dict[str, List[str]], Dict[str, List[str]]]:
+    """빈도 계산, 항목 분류, 항목별 상위 키워드 선택을 한 번의 순회로 처리합니다.
+
+    Counter + classify_keywords_by_section + get_top_keywords_by_section과 같은 결과를 반환합니다.
+    빈도 점수는 1회 이상이면 최대값이므로 순회 중 누적된 빈도로 계산해도 가중치가 같습니다.
+    """
+    product_tokens_lower = tuple(token.lower() for token in product_tokens)
+    keyword_frequency = Counter()
+    section_keywords = {section: [] for section in _SECTION_KEYWORD_SETS}
+    # 항목별 크기 top_n의 최소 힙 (가중치, -순서, 키워드): 같은 가중치면 먼저 나온 키워드 우선
+    section_heaps = {section: [] for section in _SECTION_KEYWORD_SETS}
+    
+    for order, keyword in enumerate(all_keywords):
+        keyword_frequency[keyword] += 1
+        keyword_lower = keyword.lower()
+        section = _classify_keyword(keyword, keyword_lower)
+        section_keywords[section].append(keyword)
+        
+        entry = (_keyword_weight(keyword, keyword_lower, product_tokens_lower, keyword_frequency[keyword]), -order, keyword)
+        heap = section_heaps[section]
+        if len(heap) < top_n:
+            heapq.heappush(heap, entry)
+        elif heap and entry > heap[0]:
+            heapq.heapreplace(heap, entry)
     
-    # 항목별 프롬프트 템플릿 (한국 의약품 설명서 구조에 맞춤)
-    section_prompts = {
-        "성분 및 함량": """너는 의약품 개요서를 작성하는 전문가야.
+    top_keywords_by_section = {
+        section: [keyword for _, _, keyword in sorted(heap, reverse=True)]
+        for section, heap in section_heaps.items()
+        if section_keywords[section]
+    }
+    return keyword_frequency, section_keywords, top_keywords_by_section
+
+# 항목별 프롬프트 템플릿 (한국 의약품 설명서 구조에 맞춤)
+_SECTION_PROMPTS = {
+    "성분 및 함량": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "성분 및 함량" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -391,7 +466,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "성분 및 함량": "[키워드 기반 또는 일반적인 성분 및 함량 설명]"
 }}""",
 
-        "성상": """너는 의약품 개요서를 작성하는 전문가야.
+    "성상": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "성상" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -410,7 +485,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "성상": "[키워드 기반 또는 일반적인 성상 설명]"
 }}""",
 
-        "효능 및 효과": """너는 의약품 개요서를 작성하는 전문가야.
+    "효능 및 효과": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "효능 및 효과" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -429,7 +504,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "효능 및 효과": "[키워드 기반 또는 일반적인 효능 및 효과 설명]"
 }}""",
 
-        "용법 및 용량": """너는 의약품 개요서를 작성하는 전문가야.
+    "용법 및 용량": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "용법 및 용량" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -448,7 +523,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "용법 및 용량": "[키워드 기반 또는 일반적인 용법 및 용량 설명]"
 }}""",
 
-        "사용상 주의사항": """너는 의약품 개요서를 작성하는 전문가야.
+    "사용상 주의사항": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "사용상 주의사항" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -467,7 +542,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "사용상 주의사항": "[키워드 기반 또는 일반적인 사용상 주의사항 설명]"
 }}""",
 
-        "상호작용": """너는 의약품 개요서를 작성하는 전문가야.
+    "상호작용": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "상호작용" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -486,7 +561,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "상호작용": "[키워드 기반 또는 일반적인 상호작용 설명]"
 }}""",
 
-        "임부 및 수유부 사용": """너는 의약품 개요서를 작성하는 전문가야.
+    "임부 및 수유부 사용": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "임부 및 수유부 사용" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -505,7 +580,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "임부 및 수유부 사용": "[키워드 기반 또는 일반적인 임부 및 수유부 사용 설명]"
 }}""",
 
-        "고령자 사용": """너는 의약품 개요서를 작성하는 전문가야.
+    "고령자 사용": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "고령자 사용" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -524,7 +599,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "고령자 사용": "[키워드 기반 또는 일반적인 고령자 사용 설명]"
 }}""",
 
-        "적용 시 주의사항": """너는 의약품 개요서를 작성하는 전문가야.
+    "적용 시 주의사항": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "적용 시 주의사항" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -543,7 +618,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "적용 시 주의사항": "[키워드 기반 또는 일반적인 적용 시 주의사항 설명]"
 }}""",
 
-        "보관 및 취급": """너는 의약품 개요서를 작성하는 전문가야.
+    "보관 및 취급": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "보관 및 취급" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -562,7 +637,7 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
   "보관 및 취급": "[키워드 기반 또는 일반적인 보관 및 취급 설명]"
 }}""",
 
-        "제조 및 판매사 정보": """너는 의약품 개요서를 작성하는 전문가야.
+    "제조 및 판매사 정보": """너는 의약품 개요서를 작성하는 전문가야.
 제품명은 "{product_name}"이고, 지금은 "제조 및 판매사 정보" 항목을 작성 중이야.
 
 이 항목에 대한 키워드는 다음과 같아:
@@ -580,84 +655,67 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
 {{
   "제조 및 판매사 정보": "[키워드 기반 또는 일반적인 제조 및 판매사 정보 설명]"
 }}"""
-    }
-    
-    for section, keywords in section_keywords.items():
+}
+
+# 항목별 문장 생성을 동시에 요청할 최대 스레드 수 (항목 수 12개 기준)
+_MAX_SECTION_WORKERS = 12
+
+class _NoLLMSentence(Exception):
+    """LLM 응답에서 쓸 만한 문장을 얻지 못했음을 알립니다 (실패 결과가 캐시되지 않도록 예외로 전달)."""
+
+def _fallback_section_sentence(product_name: str, section: str, keywords: List[str]) -> str:
+    """LLM 문장을 얻지 못했을 때 사용하는 기본 문장을 만듭니다."""
+    if keywords:
+        # 키워드로 직접 문장 생성
+        keywords_str = ", ".join(keywords)
+        return f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
+    return f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
+
+def _parse_llm_result(result: Any, section: str, allow_other_keys: bool = False) -> Any:
+    """LLM 응답(dict 또는 JSON이 섞인 문자열)에서 항목 문장을 꺼냅니다.
+
+    문자열 응답은 첫 '{'부터 마지막 '}'까지를 JSON으로 해석합니다.
+    allow_other_keys이면 dict 응답에 항목 키가 없을 때 첫 문자열 값을 사용합니다.
+    문장을 찾지 못하면 _NoLLMSentence를 던집니다.
+    """
+    if isinstance(result, str) and result.strip():
+        json_start = result.find('{')
+        json_end = result.rfind('}')
+        if json_start == -1 or json_end == -1:
+            raise _NoLLMSentence(section)
         try:
-            if keywords:
-                # 키워드가 있는 경우: 키워드 기반 문장 생성
-                prompt_template = section_prompts.get(section, "")
-                if prompt_template:
-                    prompt = prompt_template.format(
-                        product_name=product_name or "정보 없음",
-                        keywords=str(keywords)
-                    )
-                    
-                    print(f"🔍 {section} 항목 처리 중...")
-                    print(f"   제품명: {product_name}")
-                    print(f"   키워드: {keywords}")
-                    
-                    # LLM 호출
-                    result = generate_overview_with_llm(prompt, "")
-                    print(f"   LLM 응답: {result}")
-                    
-                    # 결과 파싱
-                    if isinstance(result, dict) and result:
-                        # JSON 응답인 경우
-                        if section in result:
-                            generated_sentences[section] = result[section]
-                            print(f"   ✅ {section} 문장 생성 성공: {result[section]}")
-                        else:
-                            # 다른 형태의 JSON 응답 처리
-                            for key, value in result.items():
-                                if isinstance(value, str):
-                                    generated_sentences[section] = value
-                                    print(f"   ✅ {section} 문장 생성 성공 (대체 키): {value}")
-                                    break
-                            else:
-                                # 키워드로 직접 문장 생성
-                                keywords_str = ", ".join(keywords)
-                                generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                                print(f"   ✅ {section} 키워드 기반 문장 생성")
-                    elif isinstance(result, str) and result.strip():
-                        # 문자열 응답인 경우 JSON 파싱 시도
-                        try:
-                            json_start = result.find('{')
-                            json_end = result.rfind('}')
-                            if json_start != -1 and json_end != -1:
-                                json_str = result[json_start:json_end+1]
-                                parsed = json.loads(json_str)
-                                if section in parsed:
-                                    generated_sentences[section] = parsed[section]
-                                    print(f"   ✅ {section} 문장 생성 성공 (JSON 추출): {parsed[section]}")
-                                else:
-                                    # 키워드로 직접 문장 생성
-                                    keywords_str = ", ".join(keywords)
-                                    generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                                    print(f"   ✅ {section} 키워드 기반 문장 생성")
-                            else:
-                                # 키워드로 직접 문장 생성
-                                keywords_str = ", ".join(keywords)
-                                generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                                print(f"   ✅ {section} 키워드 기반 문장 생성")
-                        except json.JSONDecodeError:
-                            # 키워드로 직접 문장 생성
-                            keywords_str = ", ".join(keywords)
-                            generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                            print(f"   ✅ {section} 키워드 기반 문장 생성")
-                    else:
-                        # 빈 응답인 경우 키워드로 직접 문장 생성
-                        keywords_str = ", ".join(keywords)
-                        generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                        print(f"   ✅ {section} 키워드 기반 문장 생성")
-                else:
-                    # 키워드로 직접 문장 생성
-                    keywords_str = ", ".join(keywords)
-                    generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-                    print(f"   ✅ {section} 키워드 기반 문장 생성")
-            else:
-                # 키워드가 없는 경우: LLM에게 해당 항목에 맞는 문장 생성 요청
-                no_keyword_prompt = f"""너는 식약처 CTD 기반 의약품 개요서를 작성하는 AI야.
+            parsed = json.loads(result[json_start:json_end+1])
+        except json.JSONDecodeError:
+            raise _NoLLMSentence(section)
+        if section in parsed:
+            return parsed[section]
+    elif isinstance(result, dict) and result:
+        if section in result:
+            return result[section]
+        if allow_other_keys:
+            for value in result.values():
+                if isinstance(value, str):
+                    return value
+    raise _NoLLMSentence(section)
+
+@functools.lru_cache(maxsize=1024)
+def _llm_section_sentence(product_name: str, section: str, keywords: Tuple[str, ...]) -> str:
+    """항목 하나의 문장을 LLM으로 생성합니다.
+
+    같은 (제품명, 항목, 키워드)는 다시 LLM을 호출하지 않도록 캐시하며,
+    문장을 얻지 못하면 _NoLLMSentence를 던져 실패 결과는 캐시하지 않습니다.
+    """
+    if keywords:
+        # 키워드가 있는 경우: 키워드 기반 문장 생성
+        prompt = _SECTION_PROMPTS[section].format(
+            product_name=product_name or "정보 없음",
+            keywords=str(list(keywords))
+        )
+        
+        logger.debug("🔍 %s 항목 처리 중... (제품명: %s, 키워드: %s)", section, product_name, list(keywords))
+    else:
+        # 키워드가 없는 경우: LLM에게 해당 항목에 맞는 문장 생성 요청
+        prompt = f"""너는 식약처 CTD 기반 의약품 개요서를 작성하는 AI야.
 제품명은 "{product_name}"이고, 지금은 "{section}" 항목을 작성 중이야.
 이 항목에 대한 정보가 문서에서 추출되지 않았어.
 
@@ -667,58 +725,45 @@ def generate_section_sentences(product_name: str, section_keywords: Dict[str, Li
 {{
   "{section}": "[해당 항목에 맞는 일반적인 설명 문장]"
 }}"""
-                
-                print(f"🔍 {section} 항목 처리 중... (정보 없음)")
-                print(f"   제품명: {product_name}")
-                print(f"   키워드: 없음 - LLM에게 문장 생성 요청")
-                
-                # LLM 호출
-                result = generate_overview_with_llm(no_keyword_prompt, "")
-                print(f"   LLM 응답: {result}")
-                
-                # 결과 파싱
-                if isinstance(result, dict) and result:
-                    if section in result:
-                        generated_sentences[section] = result[section]
-                        print(f"   ✅ {section} LLM 문장 생성 성공: {result[section]}")
-                    else:
-                        # 기본 문장 생성
-                        generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-                        print(f"   ⚠️ {section} 기본 문장 생성")
-                elif isinstance(result, str) and result.strip():
-                    try:
-                        json_start = result.find('{')
-                        json_end = result.rfind('}')
-                        if json_start != -1 and json_end != -1:
-                            json_str = result[json_start:json_end+1]
-                            parsed = json.loads(json_str)
-                            if section in parsed:
-                                generated_sentences[section] = parsed[section]
-                                print(f"   ✅ {section} LLM 문장 생성 성공: {parsed[section]}")
-                            else:
-                                generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-                                print(f"   ⚠️ {section} 기본 문장 생성")
-                        else:
-                            generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-                            print(f"   ⚠️ {section} 기본 문장 생성")
-                    except json.JSONDecodeError:
-                        generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-                        print(f"   ⚠️ {section} 기본 문장 생성")
-                else:
-                    generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-                    print(f"   ⚠️ {section} 기본 문장 생성")
-            
-        except Exception as e:
-            print(f"❌ 문장 생성 오류 ({section}): {e}")
-            if keywords:
-                # 키워드가 있는 경우 키워드 기반 문장 생성
-                keywords_str = ", ".join(keywords)
-                generated_sentences[section] = f"{product_name}의 {section}는 {keywords_str}를 포함합니다."
-            else:
-                # 키워드가 없는 경우 기본 문장
-                generated_sentences[section] = f"{product_name}의 {section}에 대한 정보가 제공되지 않았습니다."
-    
-    return generated_sentences
+        
+        logger.debug("🔍 %s 항목 처리 중... (정보 없음, 제품명: %s) - LLM에게 문장 생성 요청", section, product_name)
+    
+    # LLM 호출
+    result = generate_overview_with_llm(prompt, "")
+    logger.debug("   LLM 응답: %s", result)
+    
+    # 결과 파싱 (키워드 기반 요청은 다른 키의 문자열 값도 허용)
+    sentence = _parse_llm_result(result, section, allow_other_keys=bool(keywords))
+    logger.debug("   ✅ %s 문장 생성 성공: %s", section, sentence)
+    return sentence
+
+def _generate_section_sentence(product_name: str, section: str, keywords: List[str]) -> str:
+    """항목 하나의 문장을 생성합니다 (실패 시 기본 문장)."""
+    try:
+        if keywords and section not in _SECTION_PROMPTS:
+            # 프롬프트가 없는 항목은 키워드로 직접 문장 생성
+            logger.debug("   ✅ %s 키워드 기반 문장 생성", section)
+            return _fallback_section_sentence(product_name, section, keywords)
+        return _llm_section_sentence(product_name, section, tuple(keywords or ()))
+    except _NoLLMSentence:
+        logger.info("   ⚠️ %s 기본 문장 생성", section)
+    except Exception as e:
+        logger.error("❌ 문장 생성 오류 (%s): %s", section, e)
+    return _fallback_section_sentence(product_name, section, keywords)
+
+def generate_section_sentences(product_name: str, section_keywords: Dict[str, List[str]]) -> Dict[str, str]:
+    """각 항목별로 LLM 프롬프트로 문장을 생성합니다."""
+    if not section_keywords:
+        return {}
+    
+    # 항목별 LLM 호출은 서로 독립적인 네트워크 대기이므로 스레드로 동시에 요청
+    sections = list(section_keywords)
+    with ThreadPoolExecutor(max_workers=min(_MAX_SECTION_WORKERS, len(sections))) as executor:
+        sentences = executor.map(
+            lambda section: _generate_section_sentence(product_name, section, section_keywords[section]),
+            sections
+        )
+        return dict(zip(sections, sentences))
 
 def extract_medical_data_from_text(text: str, user_product_name: str = "") -> Dict[str, Any]:
     """텍스트에서 의약품 관련 데이터를 추출합니다 (토큰 단위 키워드 수집 구조)."""
@@ -726,52 +771,44 @@ def extract_medical_data_from_text(text: str, user_product_name: str = "") -> Di
     
     # Ollama 연결 상태 확인
     if not test_ollama_connection():
-        print("⚠️ Ollama에 연결할 수 없습니다. Ollama 서비스를 시작해주세요.")
+        logger.warning("⚠️ Ollama에 연결할 수 없습니다. Ollama 서비스를 시작해주세요.")
         return {"3.2.P.1": {}, "3.2.P.2": {}}
     
     # 제품명이 없으면 오류 반환
     if not user_product_name:
-        print("❌ 제품명이 입력되지 않았습니다.")
+        logger.error("❌ 제품명이 입력되지 않았습니다.")
         return {"3.2.P.1": {}, "3.2.P.2": {}}
     
     product_name = user_product_name
-    print(f"사용자 입력 제품명: {product_name}")
+    logger.info("사용자 입력 제품명: %s", product_name)
     
     # 1단계: 제품명 토큰화
-    print("1단계: 제품명 토큰화 중...")
+    logger.info("1단계: 제품명 토큰화 중...")
     product_tokens = tokenize_product_name(product_name)
-    print(f"제품명 토큰: {product_tokens}")
+    logger.debug("제품명 토큰: %s", product_tokens)
     
     # 2단계: 텍스트를 토큰 단위로 분할
-    print("2단계: 텍스트를 토큰 단위로 분할 중...")
+    logger.info("2단계: 텍스트를 토큰 단위로 분할 중...")
     tokens = split_into_tokens(text)
-    print(f"총 {len(tokens)}개의 토큰으로 분할됨")
+    logger.info("총 %d개의 토큰으로 분할됨", len(tokens))
     
     # 3단계: 토큰에서 키워드 추출
-    print("3단계: 토큰에서 키워드 추출 중...")
+    logger.info("3단계: 토큰에서 키워드 추출 중...")
     all_keywords = extract_keywords_from_tokens(tokens)
-    print(f"추출된 총 키워드 수: {len(all_keywords)}")
-    
-    # 4단계: 키워드 출현 빈도 계산
-    print("4단계: 키워드 출현 빈도 계산 중...")
-    keyword_frequency = Counter(all_keywords)
+    logger.info("추출된 총 키워드 수: %d", len(all_keywords))
     
-    # 5단계: 키워드를 항목별로 분류
-    print("5단계: 키워드 항목별 분류 중...")
-    section_keywords = classify_keywords_by_section(all_keywords)
-    
-    # 6단계: 각 항목별 상위 3개 키워드 선택
-    print("6단계: 각 항목별 상위 키워드 선택 중...")
-    top_keywords_by_section = get_top_keywords_by_section(
-        section_keywords, product_tokens, keyword_frequency, top_n=3
+    # 4~6단계: 키워드 출현 빈도 계산, 항목별 분류, 각 항목별 상위 3개 키워드 선택 (한 번의 순회)
+    logger.info("4~6단계: 키워드 빈도 계산, 항목별 분류 및 상위 키워드 선택 중...")
+    keyword_frequency, section_keywords, top_keywords_by_section = _collect_section_keywords(
+        all_keywords, product_tokens, top_n=3
     )
     
     # 7단계: 각 항목별 문장 생성
-    print("7단계: 항목별 문장 생성 중...")
+    logger.info("7단계: 항목별 문장 생성 중...")
     generated_sentences = generate_section_sentences(product_name, top_keywords_by_section)
     
     # 8단계: 한국 의약품 설명서 구조로 변환
-    print("8단계: 한국 의약품 설명서 구조로 변환 중...")
+    logger.info("8단계: 한국 의약품 설명서 구조로 변환 중...")
     final_data = create_korean_medicine_structure(product_name, generated_sentences)
     
     # 디버깅 정보 저장 (Streamlit 세션에 저장)
@@ -792,195 +829,543 @@ def extract_medical_data_from_text(text: str, user_product_name: str = "") -> Di
             st.session_state['debug_sentences'] = generated_sentences
     except ImportError:
         # Streamlit이 없는 환경에서는 디버깅 정보를 출력만
-        print("디버깅 정보:")
-        print(f"전체 키워드: {all_keywords}")
-        print(f"제품명 토큰: {product_tokens}")
-        print(f"항목별 키워드: {section_keywords}")
-        print(f"상위 키워드: {top_keywords_by_section}")
-        print(f"생성된 문장: {generated_sentences}")
-        print(f"토큰 정보: {len(tokens)}개 토큰")
-    
-    print(f"최종 결과: {final_data}")
+        logger.debug("디버깅 정보:")
+        logger.debug("전체 키워드: %s", all_keywords)
+        logger.debug("제품명 토큰: %s", product_tokens)
+        logger.debug("항목별 키워드: %s", section_keywords)
+        logger.debug("상위 키워드: %s", top_keywords_by_section)
+        logger.debug("생성된 문장: %s", generated_sentences)
+        logger.debug("토큰 정보: %d개 토큰", len(tokens))
+    
+    logger.debug("최종 결과: %s", final_data)
     return final_data
 
+def _find_json_object(text: str, is_complete: Callable[[Dict[str, Any]], bool]) -> Optional[Dict[str, Any]]:
+    """텍스트의 각 '{' 위치에서 괄호가 맞는 JSON 객체를 읽어, is_complete를 만족하는 첫 객체를 반환합니다.
+
+    앞뒤 설명에 다른 중괄호나 예시 객체가 있어도 답 객체만 골라냅니다.
+    """
+    start = text.find('{')
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict) and is_complete(parsed):
+            return parsed
+        start = text.find('{', start + 1)
+    return None
+
+def _fast_extract_json(client: Any, response_text: str, is_answer: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Optional[Dict[str, Any]]:
+    """응답 텍스트에서 JSON 객체를 orjson으로 파싱합니다.
+
+    전체 범위 파싱이 실패하면 is_answer를 만족하는 객체를 찾고, 그래도 없으면 클라이언트의 추출 함수로 다시 시도합니다.
+    """
+    match = _JSON_RE.search(response_text)
+    if match:
+        try:
+            return orjson.loads(match.group())
+        except orjson.JSONDecodeError:
+            pass
+        if is_answer is not None:
+            found = _find_json_object(response_text, is_answer)
+            if found is not None:
+                return found
+    return client.extract_json_from_response(response_text)
+
+# 모든 Ollama 호출이 함께 쓰는 클라이언트 (HTTP 연결과 세션을 재사용하도록 한 번만 생성)
+# OLLAMA_MODEL을 지정하면 그 모델 태그를 사용 (예: llama3.1:8b-instruct-q4_K_M, 없으면 클라이언트 기본 모델)
+_OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL")
+_client = None
+_client_lock = threading.Lock()
+
+def _get_client():
+    """공유 OllamaClient를 반환합니다 (처음 호출할 때 생성, 스레드 안전)."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from llm.ollama_client import OllamaClient
+                _client = OllamaClient(model=_OLLAMA_MODEL) if _OLLAMA_MODEL else OllamaClient()
+    return _client
+
+# /api/generate에 함께 보낼 설정: 항목 사이에 모델이 내려가지 않도록 keep_alive를 길게, 프롬프트 처리는 넓은 배치로
+_OLLAMA_GENERATE_OPTIONS = {
+    "options": {"num_batch": 512, "num_ctx": 2048},
+    "keep_alive": "30m",
+}
+
+# 디스크 캐시 키에 넣는 모델/설정 정보 (OLLAMA_MODEL이나 생성 설정을 바꾸면 이전 모델의 결과를 쓰지 않음)
+_LLM_CACHE_SALT = json.dumps([_OLLAMA_MODEL, _OLLAMA_GENERATE_OPTIONS], ensure_ascii=False, sort_keys=True)
+
+@functools.lru_cache(maxsize=None)
+def _accepts_options(func: Any) -> bool:
+    """클라이언트 메서드가 Ollama 설정 인자(options, keep_alive)를 받는지 시그니처로 한 번만 확인합니다."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    names = {p.name for p in parameters}
+    return any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters) or names.issuperset(_OLLAMA_GENERATE_OPTIONS)
+
+def _call_with_options(method: Any, prompt: str) -> Any:
+    """Ollama 설정과 함께 클라이언트 메서드를 호출합니다 (옵션 인자를 받지 않는 메서드는 기본 설정으로 호출)."""
+    # 메서드 안에서 난 TypeError까지 삼켜 같은 요청을 다시 보내지 않도록, 호출 방식은 시그니처로 미리 정함
+    if _accepts_options(getattr(method, '__func__', method)):
+        return method(prompt, **_OLLAMA_GENERATE_OPTIONS)
+    return method(prompt)
+
+def _read_stream_until_json(stream: Iterable[str], is_complete: Callable[[Dict[str, Any]], bool]) -> str:
+    """스트리밍 응답 조각을 모으다가 기대한 키를 가진 JSON 객체가 나오면 생성을 끊고 모인 텍스트를 반환합니다.
+
+    파싱되더라도 is_complete를 만족하지 않는 객체(설명 속 예시 등)에서는 멈추지 않고 끝까지 읽습니다.
+    """
+    pieces = []
+    try:
+        for delta in stream:
+            pieces.append(delta)
+            # 닫는 괄호가 들어온 조각에서만 JSON 완결 여부를 확인 (앞에 나온 다른 중괄호와 섞이지 않게 '{'마다 따로 읽음)
+            if '}' in delta:
+                text = ''.join(pieces)
+                if _find_json_object(text, is_complete) is not None:
+                    return text
+    finally:
+        # 남은 토큰을 기다리지 않도록 연결을 닫음
+        close = getattr(stream, 'close', None)
+        if close:
+            close()
+    return ''.join(pieces)
+
+def _ollama_generate(prompt: str, is_complete: Callable[[Dict[str, Any]], bool]) -> str:
+    """Ollama 응답 텍스트를 반환합니다 (오류 시 빈 문자열).
+
+    클라이언트가 generate_response_stream을 제공하면 스트리밍으로 받고,
+    is_complete를 만족하는 JSON 객체가 완결되는 즉시 생성을 중단합니다.
+    """
+    client = _get_client()
+    generate_stream = getattr(client, "generate_response_stream", None)
+    if generate_stream is not None:
+        return _read_stream_until_json(_call_with_options(generate_stream, prompt), is_complete)
+    
+    result = _call_with_options(client.generate_response, prompt)
+    if result.get("error", False):
+        logger.warning("   ❌ Ollama 오류: %s", result.get('text', 'Unknown error'))
+        return ""
+    return result.get("text", "")
+
+# 항목별 정제/생성 프롬프트의 고정 앞부분 (제품과 항목에 관계없이 같은 접두어를 공유해 Ollama 프롬프트 캐시를 재사용)
+_FIELD_PROMPT_PREAMBLE = """너는 한국 의약품 개요서를 작성하는 전문가야.
+아래 항목의 원본이 있으면 자연스러운 한국어 1-2문장으로 정제하고, 원본이 "없음"이면 의약품 상식과 제품명 정보를 바탕으로 1-2문장으로 생성해주세요.
+응답은 JSON 형식으로만 반환해주세요: {"<JSON 키>": "내용"}"""
+
+def _build_prompt(product_name: str, section_name: str, subsection_name: Optional[str], source: Optional[str]) -> str:
+    """고정 앞부분 뒤에 항목별 정보(제품명, 항목, 원본)를 붙여 정제/생성 프롬프트를 만듭니다.
+
+    바뀌는 값은 모두 끝에 두고 제품명을 그 맨 앞에 두어, 같은 제품의 항목들은 제품명까지 접두어를 공유합니다.
+    """
+    field_name = f"{section_name}-{subsection_name}" if subsection_name else section_name
+    return f"""{_FIELD_PROMPT_PREAMBLE}
+---
+제품명: {product_name}
+JSON 키: {subsection_name or section_name}
+항목: {field_name}
+원본: {source or "없음"}"""
+
+@functools.lru_cache(maxsize=1024)
+@llm_cache(salt=_LLM_CACHE_SALT)
+def _field_content_with_ollama(product_name: str, section_name: str, subsection_name: Optional[str], source: Optional[str]) -> str:
+    """항목 내용을 Ollama로 정제(source가 있을 때)하거나 생성합니다.
+
+    같은 입력은 메모리와 디스크에 캐시하며, 파싱까지 성공한 내용만 저장합니다 (실패 시 _NoLLMSentence).
+    """
+    client = _get_client()
+    
+    action = "정제" if source else "생성"
+    prompt = _build_prompt(product_name, section_name, subsection_name, source)
+    
+    logger.debug("🔧 %s%s 항목 Ollama %s 중...", section_name, ' - ' + subsection_name if subsection_name else '', action)
+    
+    json_key = subsection_name or section_name
+    
+    def has_answer(parsed: Dict[str, Any]) -> bool:
+        return json_key in parsed or section_name in parsed
+    
+    response_text = _ollama_generate(prompt, has_answer)
+    if not response_text:
+        raise _NoLLMSentence(section_name)
+    
+    # JSON 추출
+    json_result = _fast_extract_json(client, response_text, has_answer)
+    
+    if json_result:
+        if subsection_name and subsection_name in json_result:
+            content = json_result[subsection_name]
+            logger.debug("   ✅ %s %s 성공: %s...", subsection_name, action, content[:50])
+            return content
+        elif section_name in json_result:
+            content = json_result[section_name]
+            logger.debug("   ✅ %s %s 성공: %s...", section_name, action, content[:50])
+            return content
+    
+    # JSON 파싱 실패
+    raise _NoLLMSentence(section_name)
+
+@functools.lru_cache(maxsize=4096)
+def _default_sentence(product_name: str, section_name: str, subsection_name: Optional[str]) -> str:
+    """Ollama로 내용을 얻지 못한 항목에 쓰는 기본 문장을 반환합니다 (같은 항목은 같은 문자열을 재사용)."""
+    suffix = f" - {subsection_name}" if subsection_name else ""
+    return f"{product_name}의 {section_name}{suffix}에 대한 정보입니다."
+
+# 정제 없이 그대로 쓸 완결된 문장의 최소 길이와 문장 끝 (예: "흰색 정제입니다.")
+_DIRECT_MIN_LENGTH = 4
+_SENTENCE_ENDINGS = ('다.', '요.')
+
+def _needs_refine(text: str) -> bool:
+    """Ollama 정제가 필요한 텍스트인지 확인합니다 (너무 짧거나 문장으로 끝나지 않으면 정제)."""
+    text = text.rstrip()
+    return len(text) < _DIRECT_MIN_LENGTH or not text.endswith(_SENTENCE_ENDINGS)
+
+def _clean_for_refinement(product_name: str, original_text: str, section_name: str, subsection_name: Optional[str]) -> Tuple[str, Optional[str]]:
+    """원본 텍스트를 외국어 제거로 정제하고, Ollama 없이 결과가 정해지면 그 결과도 함께 반환합니다."""
+    # 기본 한국어 정제 (외국어 제거)
+    cleaned_text = clean_foreign_languages(original_text)
+    
+    # 한국어가 아닌 경우 기본 문장 반환
+    if not is_korean_text(cleaned_text) and not is_korean_text(original_text):
+        return cleaned_text, _default_sentence(product_name, section_name, subsection_name)
+    
+    # 텍스트가 이미 깨끗하고 한국어인 경우 그대로 반환 (짧아도 완결된 문장이면 정제하지 않음)
+    if is_korean_text(cleaned_text) and (len(cleaned_text.strip()) > 10 or not _needs_refine(cleaned_text)):
+        return cleaned_text, cleaned_text
+    
+    # Ollama 호출이 필요한 경우
+    return cleaned_text, None
+
 def clean_and_improve_text_with_ollama(product_name: str, original_text: str, section_name: str, subsection_name: str = None) -> str:
     """Ollama를 사용하여 텍스트를 정제하고 개선합니다. (최적화된 버전)"""
+    default = _default_sentence(product_name, section_name, subsection_name)
     try:
-        # 기본 한국어 정제 (외국어 제거)
-        cleaned_text = clean_foreign_languages(original_text)
-        
-        # 한국어가 아닌 경우 기본 문장 반환
-        if not is_korean_text(cleaned_text) and not is_korean_text(original_text):
-            return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
-        
-        # 텍스트가 이미 깨끗하고 한국어인 경우 그대로 반환
-        if is_korean_text(cleaned_text) and len(cleaned_text.strip()) > 10:
-            return cleaned_text
+        cleaned_text, content = _clean_for_refinement(product_name, original_text, section_name, subsection_name)
+        if content is not None:
+            return content
         
         # Ollama 호출이 필요한 경우에만 실행
-        from llm.ollama_client import OllamaClient
-        client = OllamaClient()
-        
-        # 간단한 프롬프트로 속도 향상
-        if subsection_name:
-            prompt = f"""제품명: {product_name}, 항목: {section_name}-{subsection_name}
-원본: {cleaned_text}
-자연스러운 한국어로 1-2문장으로 정제해주세요. JSON 형식: {{"{subsection_name}": "내용"}}"""
-        else:
-            prompt = f"""제품명: {product_name}, 항목: {section_name}
-원본: {cleaned_text}
-자연스러운 한국어로 1-2문장으로 정제해주세요. JSON 형식: {{"{section_name}": "내용"}}"""
-        
-        print(f"🔧 {section_name}{' - ' + subsection_name if subsection_name else ''} 항목 텍스트 정제 중...")
-        
-        result = client.generate_response(prompt)
-        
-        if result.get("error", False):
-            print(f"   ❌ Ollama 오류: {result.get('text', 'Unknown error')}")
-            return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
-        
-        response_text = result.get("text", "")
-        if not response_text:
-            return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
-        
-        # JSON 추출
-        json_result = client.extract_json_from_response(response_text)
-        
-        if json_result:
-            if subsection_name and subsection_name in json_result:
-                content = json_result[subsection_name]
-                print(f"   ✅ {subsection_name} 정제 성공: {content[:50]}...")
-                return content
-            elif section_name in json_result:
-                content = json_result[section_name]
-                print(f"   ✅ {section_name} 정제 성공: {content[:50]}...")
-                return content
-        
-        # JSON 파싱 실패 시 기본 문장 반환
-        return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
+        return _field_content_with_ollama(product_name, section_name, subsection_name, cleaned_text)
         
+    except _NoLLMSentence:
+        # Ollama 오류, 빈 응답, JSON 파싱 실패 시 기본 문장 반환
+        return default
     except Exception as e:
-        print(f"❌ Ollama 텍스트 정제 오류 ({section_name}): {e}")
-        return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
+        logger.error("❌ Ollama 텍스트 정제 오류 (%s): %s", section_name, e)
+        return default
 
 def generate_missing_content_with_ollama(product_name: str, section_name: str, subsection_name: str = None) -> str:
     """Ollama를 사용하여 누락된 내용을 생성합니다. (최적화된 버전)"""
+    default = _default_sentence(product_name, section_name, subsection_name)
     try:
-        from llm.ollama_client import OllamaClient
-        
-        client = OllamaClient()
-        
-        # 간단한 프롬프트로 속도 향상
-        if subsection_name:
-            prompt = f"""제품명: {product_name}, 항목: {section_name}-{subsection_name}
-의약품 상식과 제품명 정보를 바탕으로 1-2문장으로 생성해주세요. JSON 형식: {{"{subsection_name}": "내용"}}"""
-        else:
-            prompt = f"""제품명: {product_name}, 항목: {section_name}
-의약품 상식과 제품명 정보를 바탕으로 1-2문장으로 생성해주세요. JSON 형식: {{"{section_name}": "내용"}}"""
-        
-        print(f"🔍 {section_name}{' - ' + subsection_name if subsection_name else ''} 항목 Ollama 생성 중...")
-        
-        result = client.generate_response(prompt)
-        
-        if result.get("error", False):
-            print(f"   ❌ Ollama 오류: {result.get('text', 'Unknown error')}")
-            return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
-        
-        response_text = result.get("text", "")
-        if not response_text:
-            return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
-        
-        # JSON 추출
-        json_result = client.extract_json_from_response(response_text)
-        
-        if json_result:
-            if subsection_name and subsection_name in json_result:
-                content = json_result[subsection_name]
-                print(f"   ✅ {subsection_name} 생성 성공: {content[:50]}...")
-                return content
-            elif section_name in json_result:
-                content = json_result[section_name]
-                print(f"   ✅ {section_name} 생성 성공: {content[:50]}...")
-                return content
-        
-        # JSON 파싱 실패 시 기본 문장 반환
-        return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
+        return _field_content_with_ollama(product_name, section_name, subsection_name, None)
         
+    except _NoLLMSentence:
+        # Ollama 오류, 빈 응답, JSON 파싱 실패 시 기본 문장 반환
+        return default
     except Exception as e:
-        print(f"❌ Ollama 내용 생성 오류 ({section_name}): {e}")
-        return f"{product_name}의 {section_name}{' - ' + subsection_name if subsection_name else ''}에 대한 정보입니다."
+        logger.error("❌ Ollama 내용 생성 오류 (%s): %s", section_name, e)
+        return default
+
+# create_korean_medicine_structure가 채우는 (항목, 하위 항목, 결과 구조 안의 위치) 목록 (구조에 나오는 순서)
+_FIELD_SPECS = (
+    ("성분 및 함량", None, ("성분 및 함량", 0, "규격")),
+    ("성분 및 함량", "기준", ("성분 및 함량", 0, "기준")),
+    ("성상", None, ("성상",)),
+    ("효능 및 효과", None, ("효능 및 효과", 0)),
+    ("용법 및 용량", "적응증", ("용법 및 용량", 0, "적응증")),
+    ("용법 및 용량", None, ("용법 및 용량", 0, "용량")),
+    ("사용상 주의사항", "경고", ("사용상 주의사항", "경고", 0)),
+    ("사용상 주의사항", "금기", ("사용상 주의사항", "금기", 0)),
+    ("사용상 주의사항", "주의 필요 환자", ("사용상 주의사항", "주의 필요 환자", 0)),
+    ("사용상 주의사항", "이상반응", ("사용상 주의사항", "이상반응", 0)),
+    ("상호작용", None, ("상호작용", 0)),
+    ("임부 및 수유부 사용", "임신 1~2기", ("임부 및 수유부 사용", "임신 1~2기")),
+    ("임부 및 수유부 사용", "임신 3기", ("임부 및 수유부 사용", "임신 3기")),
+    ("임부 및 수유부 사용", "수유부", ("임부 및 수유부 사용", "수유부")),
+    ("고령자 사용", None, ("고령자 사용",)),
+    ("적용 시 주의사항", None, ("적용 시 주의사항", 0)),
+    ("보관 및 취급", "보관조건", ("보관 및 취급", "보관조건")),
+    ("보관 및 취급", "포장단위", ("보관 및 취급", "포장단위")),
+    ("보관 및 취급", "주의사항", ("보관 및 취급", "주의사항", 0)),
+    ("제조 및 판매사 정보", "제조사", ("제조 및 판매사 정보", "제조사")),
+    ("제조 및 판매사 정보", "판매사", ("제조 및 판매사 정보", "판매사")),
+    ("제조 및 판매사 정보", "공장 주소", ("제조 및 판매사 정보", "공장 주소")),
+    ("제조 및 판매사 정보", "소비자상담실", ("제조 및 판매사 정보", "소비자상담실")),
+)
+_MEDICINE_STRUCTURE_FIELDS = tuple((section_name, subsection_name) for section_name, subsection_name, _ in _FIELD_SPECS)
+
+# 결과 구조의 고정된 모양 (None 자리는 호출마다 _FIELD_SPECS 위치에 채움)
+_MEDICINE_STRUCTURE_TEMPLATE = {
+    "제품명": None,
+    "성분 및 함량": [
+        {
+            "성분명": "주성분",
+            "규격": None,
+            "기준": None
+        }
+    ],
+    "성상": None,
+    "효능 및 효과": [
+        None
+    ],
+    "용법 및 용량": [
+        {
+            "적응증": None,
+            "용량": None
+        }
+    ],
+    "사용상 주의사항": {
+        "경고": [
+            None
+        ],
+        "금기": [
+            None
+        ],
+        "주의 필요 환자": [
+            None
+        ],
+        "이상반응": [
+            None
+        ]
+    },
+    "상호작용": [
+        None
+    ],
+    "임부 및 수유부 사용": {
+        "임신 1~2기": None,
+        "임신 3기": None,
+        "수유부": None
+    },
+    "고령자 사용": None,
+    "적용 시 주의사항": [
+        None
+    ],
+    "보관 및 취급": {
+        "보관조건": None,
+        "포장단위": None,
+        "주의사항": [
+            None
+        ]
+    },
+    "제조 및 판매사 정보": {
+        "제조사": None,
+        "판매사": None,
+        "공장 주소": None,
+        "소비자상담실": None
+    }
+}
+
+def _set_path(structure: Any, path: Tuple[Any, ...], value: Any) -> None:
+    """path를 따라 내려가 마지막 위치에 value를 넣습니다 (dict 키와 list 인덱스 혼용)."""
+    for segment in path[:-1]:
+        structure = structure[segment]
+    structure[path[-1]] = value
 
-def create_korean_medicine_structure(product_name: str, generated_sentences: Dict[str, str]) -> Dict[str, Any]:
-    """생성된 문장들을 한국 의약품 설명서 구조로 변환합니다 (Ollama 자동 생성 및 텍스트 정제 포함)."""
+def _max_ollama_workers(default: int = 4) -> int:
+    """OLLAMA_NUM_PARALLEL을 읽어 동시 요청 수를 정합니다 (비었거나 숫자가 아니면 기본값, 최소 1)."""
+    try:
+        workers = int(os.environ.get("OLLAMA_NUM_PARALLEL", default))
+    except ValueError:
+        logger.warning("OLLAMA_NUM_PARALLEL 값이 올바르지 않아 %d개로 진행합니다: %r", default, os.environ.get("OLLAMA_NUM_PARALLEL"))
+        workers = default
+    return max(1, workers)
+
+# 구조 항목별 Ollama 호출을 동시에 보낼 최대 스레드 수 (Ollama 서버의 OLLAMA_NUM_PARALLEL과 맞춤)
+_MAX_OLLAMA_WORKERS = _max_ollama_workers()
+
+# 일괄 정제/생성 프롬프트의 고정 앞부분
+_BATCH_PROMPT_PREAMBLE = """다음 항목들을 각각 1-2문장 한국어로 생성/정제하여 JSON으로 반환해주세요.
+mode가 "refine"이면 source를 자연스러운 한국어로 정제하고, "generate"이면 의약품 상식과 제품명 정보를 바탕으로 생성해주세요.
+JSON 형식: {"0": "내용", "1": "내용", ...} (키는 각 항목의 id)"""
+
+@llm_cache(salt=_LLM_CACHE_SALT)
+def _batch_field_contents(product_name: str, specs: List[Dict[str, Any]]) -> Dict[str, str]:
+    """항목들을 한 번의 Ollama 요청으로 생성/정제하고 {"id": 내용}을 반환합니다.
+
+    쓸 수 있는 내용을 하나도 얻지 못하면 _NoLLMSentence를 던져 실패 결과는 디스크에 캐시하지 않습니다.
+    """
+    client = _get_client()
+    
+    # 항목마다 따로 요청하면 같은 지시문과 왕복 지연을 항목 수만큼 반복하므로 한 프롬프트로 묶음
+    # (고정 지시문을 앞에, 제품명과 항목 목록을 끝에 두어 제품이 달라도 프롬프트 캐시를 재사용)
+    prompt = f"""{_BATCH_PROMPT_PREAMBLE}
+---
+제품명: {product_name}
+항목: {json.dumps(specs, ensure_ascii=False)}"""
+    
+    logger.debug("🔍 %d개 항목 Ollama 일괄 생성/정제 중...", len(specs))
+    
+    expected_keys = [str(spec["id"]) for spec in specs]
+    response_text = _ollama_generate(prompt, lambda parsed: all(key in parsed for key in expected_keys))
+    if not response_text:
+        raise _NoLLMSentence("일괄")
+    
+    # JSON 추출 (한 번만 파싱, 일부 id가 빠진 응답도 사용)
+    json_result = _fast_extract_json(client, response_text, lambda parsed: any(key in parsed for key in expected_keys))
+    if not json_result:
+        raise _NoLLMSentence("일괄")
+    
+    contents = {}
+    for key in expected_keys:
+        content = json_result.get(key)
+        if isinstance(content, str) and content.strip():
+            contents[key] = content
+    if not contents:
+        raise _NoLLMSentence("일괄")
+    return contents
+
+def _generate_fields_in_one_prompt(product_name: str, specs: List[Dict[str, Any]]) -> Dict[int, str]:
+    """Ollama가 필요한 항목들을 한 번의 요청으로 생성/정제하고 {id: 내용}을 반환합니다 (실패한 id는 빠짐)."""
+    try:
+        contents = {int(key): content for key, content in _batch_field_contents(product_name, specs).items()}
+        logger.info("   ✅ 일괄 생성/정제: %d/%d개 항목", len(contents), len(specs))
+        return contents
+        
+    except _NoLLMSentence:
+        return {}
+    except Exception as e:
+        logger.error("❌ Ollama 일괄 생성/정제 오류: %s", e)
+        return {}
+
+# 내용이 없는 것으로 보는 항목 문장 (이 값들이거나 기본 문장 문구가 들어 있으면 Ollama로 새로 생성)
+_EMPTY_SENTINELS = frozenset({"", "정보 없음", "N/A", "없음"})
+_NO_INFO_PHRASE = "정보가 제공되지 않았습니다"
+
+def _is_missing_content(content: str) -> bool:
+    """항목 문장이 비어 있거나 '정보 없음'류의 표시 문구인지 확인합니다."""
+    return content in _EMPTY_SENTINELS or _NO_INFO_PHRASE in content
+
+def _checkpoint_key(product_name: str, section_name: str, subsection_name: Optional[str], source: str) -> str:
+    """체크포인트 파일에 기록하는 항목 키를 만듭니다 (제품명과 원본 내용 해시를 포함해 다른 입력의 기록은 쓰지 않음)."""
+    source_hash = hashlib.blake2b(source.encode('utf-8'), digest_size=8).hexdigest()
+    return f"{product_name}||{section_name}||{subsection_name or ''}||{source_hash}"
+
+def _load_checkpoint(checkpoint_path: str) -> Dict[str, str]:
+    """체크포인트 JSONL({"k": 키, "v": 내용} 한 줄씩)에서 이미 완료된 항목을 읽습니다."""
+    if not os.path.exists(checkpoint_path):
+        return {}
+    
+    completed = {}
+    with open(checkpoint_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                completed[entry["k"]] = entry["v"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # 중단 시점에 잘린 줄 등은 건너뜀
+                continue
+    return completed
+
+def _discard_checkpoint_entries(checkpoint_path: str, keys: set) -> None:
+    """체크포인트에서 완료된 구조의 항목을 지웁니다 (다른 제품/입력의 기록만 남으면 다시 쓰고, 없으면 파일 삭제)."""
+    remaining = {k: v for k, v in _load_checkpoint(checkpoint_path).items() if k not in keys}
+    if not remaining:
+        try:
+            os.remove(checkpoint_path)
+        except FileNotFoundError:
+            pass
+        return
     
-    def get_content_or_generate(section_name: str, subsection_name: str = None) -> str:
+    temp_path = checkpoint_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for k, v in remaining.items():
+            f.write(json.dumps({"k": k, "v": v}, ensure_ascii=False) + "\n")
+    os.replace(temp_path, checkpoint_path)
+
+def create_korean_medicine_structure(product_name: str, generated_sentences: Dict[str, str], checkpoint_path: Optional[str] = None) -> Dict[str, Any]:
+    """생성된 문장들을 한국 의약품 설명서 구조로 변환합니다 (Ollama 자동 생성 및 텍스트 정제 포함).
+
+    checkpoint_path를 주면 Ollama로 얻은 항목 내용을 즉시 JSONL로 기록하고,
+    다시 실행할 때 제품명과 원본이 같은 항목은 Ollama를 호출하지 않고 그대로 사용합니다.
+    모든 항목을 Ollama로 얻어 구조가 완성되면 체크포인트에서 이 구조의 항목을 지웁니다.
+    """
+    
+    def get_content_or_generate(field: Tuple[str, Optional[str]]) -> str:
         """내용이 없으면 Ollama로 생성, 있으면 정제"""
+        section_name, subsection_name = field
         content = generated_sentences.get(section_name, "")
-        if not content or content == "정보 없음" or "정보가 제공되지 않았습니다" in content:
+        if _is_missing_content(content):
             return generate_missing_content_with_ollama(product_name, section_name, subsection_name)
         else:
             # 기존 내용이 있으면 정제
             return clean_and_improve_text_with_ollama(product_name, content, section_name, subsection_name)
     
-    medicine_structure = {
-        "제품명": product_name,
-        "성분 및 함량": [
-            {
-                "성분명": "주성분",
-                "규격": get_content_or_generate("성분 및 함량"),
-                "기준": get_content_or_generate("성분 및 함량", "기준")
-            }
-        ],
-        "성상": get_content_or_generate("성상"),
-        "효능 및 효과": [
-            get_content_or_generate("효능 및 효과")
-        ],
-        "용법 및 용량": [
-            {
-                "적응증": get_content_or_generate("용법 및 용량", "적응증"),
-                "용량": get_content_or_generate("용법 및 용량")
-            }
-        ],
-        "사용상 주의사항": {
-            "경고": [
-                get_content_or_generate("사용상 주의사항", "경고")
-            ],
-            "금기": [
-                get_content_or_generate("사용상 주의사항", "금기")
-            ],
-            "주의 필요 환자": [
-                get_content_or_generate("사용상 주의사항", "주의 필요 환자")
-            ],
-            "이상반응": [
-                get_content_or_generate("사용상 주의사항", "이상반응")
-            ]
-        },
-        "상호작용": [
-            get_content_or_generate("상호작용")
-        ],
-        "임부 및 수유부 사용": {
-            "임신 1~2기": get_content_or_generate("임부 및 수유부 사용", "임신 1~2기"),
-            "임신 3기": get_content_or_generate("임부 및 수유부 사용", "임신 3기"),
-            "수유부": get_content_or_generate("임부 및 수유부 사용", "수유부")
-        },
-        "고령자 사용": get_content_or_generate("고령자 사용"),
-        "적용 시 주의사항": [
-            get_content_or_generate("적용 시 주의사항")
-        ],
-        "보관 및 취급": {
-            "보관조건": get_content_or_generate("보관 및 취급", "보관조건"),
-            "포장단위": get_content_or_generate("보관 및 취급", "포장단위"),
-            "주의사항": [
-                get_content_or_generate("보관 및 취급", "주의사항")
-            ]
-        },
-        "제조 및 판매사 정보": {
-            "제조사": get_content_or_generate("제조 및 판매사 정보", "제조사"),
-            "판매사": get_content_or_generate("제조 및 판매사 정보", "판매사"),
-            "공장 주소": get_content_or_generate("제조 및 판매사 정보", "공장 주소"),
-            "소비자상담실": get_content_or_generate("제조 및 판매사 정보", "소비자상담실")
-        }
-    }
+    # 체크포인트에 있거나 Ollama 없이 정해지는 항목은 바로 채우고, 나머지는 한 번의 일괄 프롬프트로 요청
+    checkpoint = _load_checkpoint(checkpoint_path) if checkpoint_path else {}
+    contents = {}
+    checkpoint_keys = {}
+    specs = []
+    for field in _MEDICINE_STRUCTURE_FIELDS:
+        section_name, subsection_name = field
+        content = generated_sentences.get(section_name, "")
+        key = checkpoint_keys[field] = _checkpoint_key(product_name, section_name, subsection_name, content)
+        if key in checkpoint:
+            contents[field] = checkpoint[key]
+            continue
+        if _is_missing_content(content):
+            mode, source = "generate", ""
+        else:
+            source, refined = _clean_for_refinement(product_name, content, section_name, subsection_name)
+            if refined is not None:
+                contents[field] = refined
+                continue
+            mode = "refine"
+        specs.append({"id": len(specs), "section": section_name, "subsection": subsection_name or "", "mode": mode, "source": source})
+    
+    fallback_used = False
+    if specs:
+        # 체크포인트 파일은 처음 기록할 내용이 생길 때 열어, 모두 실패한 실행이 빈 파일을 남기지 않게 함
+        checkpoint_file = None
+        
+        def record(field: Tuple[str, Optional[str]], content: str) -> None:
+            """Ollama로 얻은 항목 내용을 저장하고, 체크포인트가 있으면 바로 디스크에 기록"""
+            nonlocal fallback_used, checkpoint_file
+            contents[field] = content
+            section_name, subsection_name = field
+            # 기본 문장(Ollama 실패)은 다음 실행에서 다시 시도하도록 기록하지 않음
+            if content == _default_sentence(product_name, section_name, subsection_name):
+                fallback_used = True
+            elif checkpoint_path:
+                if checkpoint_file is None:
+                    checkpoint_file = open(checkpoint_path, 'a', encoding='utf-8')
+                checkpoint_file.write(json.dumps({"k": checkpoint_keys[field], "v": content}, ensure_ascii=False) + "\n")
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+        
+        try:
+            batched = _generate_fields_in_one_prompt(product_name, specs)
+            missing = []
+            for spec in specs:
+                field = (spec["section"], spec["subsection"] or None)
+                if spec["id"] in batched:
+                    record(field, batched[spec["id"]])
+                else:
+                    missing.append(field)
+            
+            # 일괄 응답에서 빠진 항목만 항목별로 요청 (서로 독립적인 네트워크 대기이므로 동시에)
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(_MAX_OLLAMA_WORKERS, len(missing))) as executor:
+                    for field, content in zip(missing, executor.map(get_content_or_generate, missing)):
+                        record(field, content)
+        finally:
+            if checkpoint_file:
+                checkpoint_file.close()
+    
+    # 고정된 모양을 복사한 뒤 항목별 위치에 내용을 채움
+    medicine_structure = copy.deepcopy(_MEDICINE_STRUCTURE_TEMPLATE)
+    medicine_structure["제품명"] = product_name
+    for section_name, subsection_name, path in _FIELD_SPECS:
+        _set_path(medicine_structure, path, contents[(section_name, subsection_name)])
+    
+    # 완성된 구조의 기록은 더 필요 없으므로 정리 (기본 문장으로 채운 항목이 있으면 다음 실행의 재개를 위해 남김)
+    if checkpoint_path and not fallback_used:
+        _discard_checkpoint_entries(checkpoint_path, set(checkpoint_keys.values()))
     
     return medicine_structure
 
@@ -989,15 +1374,14 @@ def create_korean_ctd_structure(product_name: str, generated_sentences: Dict[str
     return create_korean_medicine_structure(product_name, generated_sentences)
 
 # 기존 함수들은 호환성을 위해 유지하되 새로운 구조를 사용하도록 수정
-def split_into_blocks(text: str) -> List[str]:
-    """텍스트를 문단 단위로 분할합니다. (호환성 유지)"""
-    return split_into_tokens(text)  # 새로운 구조 사용
+# 문단 단위 분할 대신 토큰 단위 분할을 그대로 사용 (호환성 유지, 추가 호출 단계 없음)
+split_into_blocks = split_into_tokens
 
 def split_text_into_chunks(text: str, chunk_size: int = 300, overlap: int = 50) -> List[str]:
-    """텍스트를 작은 청크로 분할합니다. (호환성 유지)"""
+    """텍스트를 토큰 단위로 분할합니다. (호환성 유지, chunk_size와 overlap은 무시)"""
     return split_into_tokens(text)  # 새로운 구조 사용
 
 def extract_medical_data_from_text_with_chunks(text: str, user_product_name: str, chunk_size: int = 200, overlap_size: int = 30) -> Dict[str, Any]:
-    """청크 기반으로 텍스트에서 의약품 관련 데이터를 추출합니다. (호환성 유지)"""
+    """텍스트에서 의약품 관련 데이터를 추출합니다. (호환성 유지, chunk_size와 overlap_size는 무시)"""
     # 새로운 구조 사용 (청크 설정은 무시하고 토큰 단위 사용)
     return extract_medical_data_from_text(text, user_product_name) 
\ No newline at end of file
@@ -1,8 +1,9 @@
 from docx import Document
 from docx.shared import Inches, Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from concurrent.futures import ProcessPoolExecutor
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 def add_heading_with_numbering(document, text, level=1):
     """번호가 있는 제목을 추가합니다."""
@@ -22,9 +23,8 @@ def create_structured_overview_document(data: Dict[str, Any], output_path: str):
     title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     # 3.2.P.1 섹션
-    if "3.2.P.1" in data and data["3.2.P.1"]:
-        p1_data = data["3.2.P.1"]
-        
+    p1_data = data.get("3.2.P.1")
+    if p1_data:
         # 제품 기본 정보
         doc.add_heading('1. 제품 기본 정보', level=1)
         
@@ -52,11 +52,15 @@ def create_structured_overview_document(data: Dict[str, Any], output_path: str):
             for i, component in enumerate(p1_data["composition_per_unit"], 1):
                 p = doc.add_paragraph()
                 p.add_run(f"{i}. ").bold = True
-                p.add_run(f"성분명: {component.get('component_name', 'N/A')}")
-                p.add_run(f" | 역할: {component.get('role', 'N/A')}")
-                p.add_run(f" | 함량: {component.get('amount', 'N/A')}")
+                # 서식이 같은 나머지 항목은 런 하나로 합쳐 추가
+                details = (
+                    f"성분명: {component.get('component_name', 'N/A')}"
+                    f" | 역할: {component.get('role', 'N/A')}"
+                    f" | 함량: {component.get('amount', 'N/A')}"
+                )
                 if component.get('standard'):
-                    p.add_run(f" | 기준: {component['standard']}")
+                    details += f" | 기준: {component['standard']}"
+                p.add_run(details)
         
         # 용기 정보
         if "container_closure_system" in p1_data:
@@ -70,9 +74,8 @@ def create_structured_overview_document(data: Dict[str, Any], output_path: str):
                 doc.add_paragraph(f"보조용기: {container['secondary'].get('description', 'N/A')}")
     
     # 3.2.P.2 섹션
-    if "3.2.P.2" in data and data["3.2.P.2"]:
-        p2_data = data["3.2.P.2"]
-        
+    p2_data = data.get("3.2.P.2")
+    if p2_data:
         # 개발 이력
         if "development_history" in p2_data:
             doc.add_heading('5. 개발 이력', level=1)
@@ -84,8 +87,7 @@ def create_structured_overview_document(data: Dict[str, Any], output_path: str):
             if "critical_materials" in history:
                 doc.add_heading('5-1. 핵심 원료', level=2)
                 for material in history["critical_materials"]:
-                    p = doc.add_paragraph()
-                    p.add_run(f"• {material.get('name', 'N/A')}: {material.get('impact', 'N/A')}")
+                    doc.add_paragraph(f"• {material.get('name', 'N/A')}: {material.get('impact', 'N/A')}")
             
             if "clinical_batch_info" in history:
                 doc.add_heading('5-2. 임상 배치 정보', level=2)
@@ -128,3 +130,22 @@ def create_structured_overview_document(data: Dict[str, Any], output_path: str):
 def export_overview_to_word(data: Dict[str, Any], output_path: str):
     """개요서를 Word 문서로 내보냅니다."""
     create_structured_overview_document(data, output_path)
+
+def export_many(jobs: List[Tuple[Dict[str, Any], str]], workers: Optional[int] = None) -> List[str]:
+    """여러 개요서를 프로세스 풀에서 병렬로 Word 문서로 내보내기
+
+    문서 생성과 저장(lxml 직렬화)은 GIL을 잡는 CPU 작업이므로 스레드 대신 프로세스를 사용합니다.
+    결과는 jobs 순서대로 저장된 경로를 반환합니다.
+    """
+    if not jobs:
+        return []
+    if len(jobs) == 1 or workers == 1:
+        for data, output_path in jobs:
+            export_overview_to_word(data, output_path)
+        return [output_path for _, output_path in jobs]
+    
+    datas = [data for data, _ in jobs]
+    output_paths = [output_path for _, output_path in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(export_overview_to_word, datas, output_paths))
+    return output_paths